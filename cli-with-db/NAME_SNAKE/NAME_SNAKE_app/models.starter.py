@@ -6,8 +6,11 @@ Add your Django models here.
 
 from __future__ import annotations
 
+from django.conf import settings
 from django.db import models
 
+from $${name_snake}.config.authentication import generate_api_token, hash_token
+
 
 class TimestampedModel(models.Model):
     """Abstract base model with created_at and updated_at fields."""
@@ -19,6 +22,32 @@ class TimestampedModel(models.Model):
         abstract = True
 
 
+class ApiToken(TimestampedModel):
+    """
+    A named API token, stored as a hash of the token value.
+
+    Used by SingleUserTokenAuthentication when HASHED_API_TOKENS is enabled.
+    """
+
+    name = models.CharField(max_length=255)
+    key_hash = models.CharField(max_length=64, unique=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="api_tokens",
+    )
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def create_token(cls, user, name: str) -> tuple[ApiToken, str]:
+        """Create a token for the user and return it with its raw value."""
+        token = generate_api_token()
+        api_token = cls.objects.create(user=user, name=name, key_hash=hash_token(token))
+        return api_token, token
+
+
 # Example model - replace with your own models
 # class Item(TimestampedModel):
 #     """An example model."""
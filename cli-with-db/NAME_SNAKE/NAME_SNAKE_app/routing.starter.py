@@ -0,0 +1,18 @@
+"""
+WebSocket routing for $${name_snake}.
+
+Add your channels consumers here.
+"""
+
+from __future__ import annotations
+
+# Example route - replace with your own consumers
+# from django.urls import path
+#
+# from $${name_snake}.$${name_snake}_app.consumers import ItemConsumer
+#
+# websocket_urlpatterns = [
+#     path("ws/items/", ItemConsumer.as_asgi()),
+# ]
+
+websocket_urlpatterns = []
@@ -12,11 +12,12 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 # Example viewset - replace with your own viewsets
+# from $${name_snake}.config.viewsets import ConditionalGetMixin
 # from $${name_snake}.$${name_snake}_app.models import Item
 # from $${name_snake}.$${name_snake}_app.serializers import ItemSerializer
 #
 #
-# class ItemViewSet(viewsets.ModelViewSet):
+# class ItemViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
 #     """ViewSet for Item model."""
 #
 #     queryset = Item.objects.all()
@@ -26,5 +27,5 @@ from rest_framework.response import Response
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def health_check(request):
-    """Health check endpoint."""
+    """Liveness probe: the process is up and serving requests."""
     return Response({"status": "ok"}, status=status.HTTP_200_OK)
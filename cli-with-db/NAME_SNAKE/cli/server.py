@@ -7,17 +7,50 @@ This module provides the CLI command to start the Django server.
 from __future__ import annotations
 
 import os
+import shutil
 import subprocess
 import sys
 
 import click
 
 from $${name_snake}.cli.utils import (
+    StartupTimer,
+    create_metrics_dir,
     get_data_dir,
+    get_latest_migration,
+    get_migrations_fingerprint,
+    get_static_fingerprint,
+    load_startup_cache,
     run_collectstatic,
     run_migrations,
+    save_startup_cache,
+    setup_django,
     setup_django_environment,
+    static_root_exists,
 )
+from $${name_snake}.config.cache import CACHE_BACKEND_ENV_VAR, get_cache_backend
+
+# Gunicorn worker class and application for each serving mode
+SERVER_MODES = {
+    "asgi": ("uvicorn.workers.UvicornWorker", "$${name_snake}.config.asgi:application"),
+    "wsgi": ("gthread", "$${name_snake}.config.wsgi:application"),
+}
+
+
+def get_default_workers(mode: str) -> int:
+    """Return the number of worker processes to start for the serving mode."""
+    cpu_count = os.cpu_count() or 1
+    if mode == "asgi":
+        # Each event loop serves many concurrent requests, so one per core
+        return cpu_count
+    # Gunicorn's recommended formula for blocking workers
+    return cpu_count * 2 + 1
+
+
+def get_default_threads() -> int:
+    """Return the number of threads per WSGI worker."""
+    # Threads overlap I/O waits; the worker count already covers the cores
+    return max(2, min(os.cpu_count() or 1, 4))
 
 
 @click.command()
@@ -34,11 +67,34 @@ from $${name_snake}.cli.utils import (
     help="Port to bind to.",
     show_default=True,
 )
+@click.option(
+    "--mode",
+    type=click.Choice(list(SERVER_MODES)),
+    default="asgi",
+    help="Serve the ASGI app (async views, websockets) or the WSGI app.",
+    show_default=True,
+)
 @click.option(
     "--workers",
-    default=1,
     type=int,
-    help="Number of worker processes.",
+    help="Number of worker processes. Defaults to a value based on CPU count.",
+)
+@click.option(
+    "--threads",
+    type=int,
+    help="Threads per worker in WSGI mode. Defaults to a value based on CPU count.",
+)
+@click.option(
+    "--max-requests",
+    default=1000,
+    type=int,
+    help="Restart each worker after this many requests (0 to disable).",
+    show_default=True,
+)
+@click.option(
+    "--preload/--no-preload",
+    default=True,
+    help="Load the app before forking so workers share memory.",
     show_default=True,
 )
 @click.option(
@@ -57,60 +113,157 @@ from $${name_snake}.cli.utils import (
     is_flag=True,
     help="Skip running collectstatic on startup.",
 )
+@click.option(
+    "--force-startup-tasks",
+    is_flag=True,
+    help="Run migrations and collectstatic even if nothing changed.",
+)
+@click.option(
+    "--startup-report",
+    is_flag=True,
+    help="Print how long each startup phase took.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Log query counts and timings for each request.",
+)
 def server(
     host: str,
     port: int,
-    workers: int,
+    mode: str,
+    workers: int | None,
+    threads: int | None,
+    max_requests: int,
+    preload: bool,
     reload_: bool,
     skip_migrations: bool,
     skip_collectstatic: bool,
+    force_startup_tasks: bool,
+    startup_report: bool,
+    profile: bool,
 ) -> None:
     """Start the $${name_pretty} server."""
+    timer = StartupTimer()
+
+    if profile:
+        # Read by settings in this process and in the gunicorn workers
+        os.environ["$${name_snake.upper()}_PROFILE"] = "true"
+
     # Set up the Django environment
-    env_vars = setup_django_environment()
-    data_dir = get_data_dir()
+    with timer.phase("environment"):
+        env_vars = setup_django_environment()
+        data_dir = get_data_dir()
+
+    workers = workers or get_default_workers(mode)
+
+    if workers > 1 and get_cache_backend() == "memory":
+        # Each worker would keep serving responses another worker invalidated
+        msg = (
+            f"{CACHE_BACKEND_ENV_VAR}=memory is private to each worker process. "
+            "Use the file backend or run with --workers 1."
+        )
+        raise click.UsageError(msg)
+
+    # Workers write metrics here so any worker can report for the whole server
+    metrics_dir = create_metrics_dir(data_dir)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = str(metrics_dir)
 
     click.echo(f"Data directory: {data_dir}")
     click.echo(f"API Token: {env_vars.get('$${name_snake.upper()}_API_TOKEN', 'Not set')}")
     click.echo()
 
+    with timer.phase("django setup"):
+        setup_django()
+
+    # Fingerprints from the last startup let unchanged work be skipped
+    cache = {} if force_startup_tasks else load_startup_cache()
+
     # Run migrations
     if not skip_migrations:
-        click.echo("Running migrations...")
-        run_migrations()
+        with timer.phase("migrations") as phase:
+            fingerprint = get_migrations_fingerprint()
+            # The database itself may have been recreated or restored since
+            latest_migration = get_latest_migration()
+            if (
+                cache.get("migrations") == fingerprint
+                and latest_migration is not None
+                and cache.get("latest_migration") == latest_migration
+            ):
+                phase.skipped = True
+                click.echo("Migrations unchanged, skipping.")
+            else:
+                click.echo("Running migrations...")
+                run_migrations()
+                cache["migrations"] = fingerprint
+                cache["latest_migration"] = get_latest_migration()
+                save_startup_cache(cache)
         click.echo()
 
     # Run collectstatic
     if not skip_collectstatic:
-        click.echo("Collecting static files...")
-        run_collectstatic()
+        with timer.phase("collectstatic") as phase:
+            fingerprint = get_static_fingerprint()
+            if cache.get("collectstatic") == fingerprint and static_root_exists():
+                phase.skipped = True
+                click.echo("Static files unchanged, skipping.")
+            else:
+                click.echo("Collecting static files...")
+                run_collectstatic()
+                cache["collectstatic"] = fingerprint
+                save_startup_cache(cache)
+        click.echo()
+
+    if startup_report:
+        click.echo(timer.format_report())
         click.echo()
 
     # Start the server
-    click.echo(f"Starting server at http://{host}:{port}")
+    click.echo(f"Starting {mode.upper()} server at http://{host}:{port}")
     click.echo("Press Ctrl+C to stop.")
     click.echo()
 
     # Build the gunicorn command
+    worker_class, app = SERVER_MODES[mode]
+
     cmd = [
         sys.executable,
         "-m",
         "gunicorn",
-        "$${name_snake}.config.wsgi:application",
+        app,
         "--bind",
         f"{host}:{port}",
         "--workers",
         str(workers),
         "--worker-class",
-        "uvicorn.workers.UvicornWorker",
+        worker_class,
         "--access-logfile",
         "-",
         "--error-logfile",
         "-",
+        "--config",
+        "python:$${name_snake}.config.gunicorn_conf",
     ]
 
+    if mode == "wsgi":
+        cmd.extend(["--threads", str(threads or get_default_threads())])
+
+    if max_requests:
+        # Jitter staggers restarts so workers don't all recycle at once
+        cmd.extend(
+            [
+                "--max-requests",
+                str(max_requests),
+                "--max-requests-jitter",
+                str(max(1, max_requests // 10)),
+            ]
+        )
+
     if reload_:
         cmd.extend(["--reload"])
+    elif preload:
+        # Preloading is incompatible with reloading
+        cmd.extend(["--preload"])
 
     # Run the server
     try:
@@ -120,3 +273,5 @@ def server(
     except subprocess.CalledProcessError as e:
         click.echo(f"Server exited with error: {e.returncode}", err=True)
         sys.exit(e.returncode)
+    finally:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
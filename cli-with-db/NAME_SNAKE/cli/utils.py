@@ -7,8 +7,16 @@ running migrations, and managing secrets.
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import json
 import os
 import secrets
+import shutil
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -23,6 +31,38 @@ def get_data_dir() -> Path:
     return data_dir
 
 
+def _process_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def create_metrics_dir(data_dir: Path) -> Path:
+    """
+    Create an empty Prometheus multiprocess directory for this server.
+
+    Each server process gets its own directory, named after its PID, so
+    servers sharing a data directory never count or delete each other's
+    samples. Directories left by servers that are no longer running are
+    removed.
+    """
+    metrics_root = data_dir / "metrics"
+    metrics_root.mkdir(exist_ok=True)
+    for path in metrics_root.iterdir():
+        if path.is_dir() and path.name.isdigit() and not _process_exists(int(path.name)):
+            shutil.rmtree(path, ignore_errors=True)
+
+    metrics_dir = metrics_root / str(os.getpid())
+    # Samples from an earlier run would be counted again
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    metrics_dir.mkdir()
+    return metrics_dir
+
+
 def get_env_file() -> Path:
     """Get the path to the .env file."""
     return get_data_dir() / ".env"
@@ -33,11 +73,6 @@ def generate_secret_key() -> str:
     return secrets.token_urlsafe(50)
 
 
-def generate_api_token() -> str:
-    """Generate a secure API token."""
-    return secrets.token_urlsafe(32)
-
-
 def ensure_env_file() -> dict[str, str]:
     """
     Ensure the .env file exists with required secrets.
@@ -64,6 +99,8 @@ def ensure_env_file() -> dict[str, str]:
         env_vars[secret_key_var] = generate_secret_key()
 
     if api_token_var not in env_vars:
+        from $${name_snake}.config.authentication import generate_api_token
+
         env_vars[api_token_var] = generate_api_token()
 
     # Write back the env file
@@ -99,19 +136,159 @@ def setup_django_environment() -> dict[str, str]:
     return env_vars
 
 
+def setup_django() -> None:
+    """Set up Django once per process."""
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+
 def run_migrations() -> None:
     """Run Django migrations."""
-    import django
     from django.core.management import call_command
 
-    django.setup()
+    setup_django()
     call_command("migrate", verbosity=1)
 
 
 def run_collectstatic() -> None:
     """Run Django collectstatic."""
-    import django
     from django.core.management import call_command
 
-    django.setup()
+    setup_django()
     call_command("collectstatic", verbosity=0, interactive=False)
+
+
+def get_startup_cache_file() -> Path:
+    """Get the path to the startup cache file."""
+    return get_data_dir() / "startup-cache.json"
+
+
+def load_startup_cache() -> dict[str, str]:
+    """Load the fingerprints recorded by the last successful startup."""
+    try:
+        return json.loads(get_startup_cache_file().read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_startup_cache(cache: dict[str, str]) -> None:
+    """Record fingerprints for the next startup."""
+    get_startup_cache_file().write_text(json.dumps(cache, indent=2, sort_keys=True))
+
+
+def get_migrations_fingerprint() -> str:
+    """
+    Fingerprint the migration files of all installed apps and the database.
+
+    Hashing the files is much cheaper than building the migration graph,
+    which imports every migration module.
+    """
+    import django
+    from django.apps import apps
+    from django.db import connection
+    from django.db.migrations.loader import MigrationLoader
+
+    setup_django()
+    hasher = hashlib.sha256()
+    hasher.update(django.get_version().encode())
+    hasher.update(str(connection.settings_dict["NAME"]).encode())
+
+    for app_config in apps.get_app_configs():
+        module_name, _ = MigrationLoader.migrations_module(app_config.label)
+        spec = module_name and importlib.util.find_spec(module_name)
+        if not spec or not spec.submodule_search_locations:
+            continue
+        for location in spec.submodule_search_locations:
+            for path in sorted(Path(location).glob("*.py")):
+                hasher.update(f"{app_config.label}/{path.name}".encode())
+                hasher.update(path.read_bytes())
+
+    return hasher.hexdigest()
+
+
+def get_static_fingerprint() -> str:
+    """Fingerprint the static source files found by the staticfiles finders."""
+    from django.conf import settings
+    from django.contrib.staticfiles.finders import get_finders
+
+    setup_django()
+    entries = []
+    for finder in get_finders():
+        for path, storage in finder.list(["CVS", ".*", "*~"]):
+            stat = os.stat(storage.path(path))
+            entries.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+
+    hasher = hashlib.sha256()
+    hasher.update(str(settings.STATIC_ROOT).encode())
+    for entry in sorted(entries):
+        hasher.update(entry.encode())
+    return hasher.hexdigest()
+
+
+def get_latest_migration() -> str | None:
+    """
+    Identify the most recently applied migration in the database.
+
+    Returns None if the database has no migrations table, e.g. because the
+    file was deleted or replaced with an empty one.
+    """
+    from django.db import DatabaseError, connection
+
+    setup_django()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT id, app, name FROM django_migrations ORDER BY id DESC LIMIT 1"
+            )
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    return None if row is None else f"{row[0]}:{row[1]}.{row[2]}"
+
+
+def static_root_exists() -> bool:
+    """Check whether collected static files exist."""
+    from django.conf import settings
+
+    setup_django()
+    return Path(settings.STATIC_ROOT).is_dir()
+
+
+@dataclass
+class StartupPhase:
+    """Timing for a single startup phase."""
+
+    name: str
+    seconds: float = 0.0
+    skipped: bool = False
+
+
+@dataclass
+class StartupTimer:
+    """Record how long each startup phase takes."""
+
+    phases: list[StartupPhase] = field(default_factory=list)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[StartupPhase]:
+        """Time the enclosed block as a startup phase."""
+        phase = StartupPhase(name)
+        start = time.perf_counter()
+        try:
+            yield phase
+        finally:
+            phase.seconds = time.perf_counter() - start
+            self.phases.append(phase)
+
+    def format_report(self) -> str:
+        """Format the recorded phases as a table."""
+        lines = ["Startup report:"]
+        for phase in self.phases:
+            status = " (skipped, unchanged)" if phase.skipped else ""
+            lines.append(f"  {phase.name:<16} {phase.seconds * 1000:>8.1f} ms{status}")
+        total = sum(phase.seconds for phase in self.phases)
+        lines.append(f"  {'total':<16} {total * 1000:>8.1f} ms")
+        return "\n".join(lines)
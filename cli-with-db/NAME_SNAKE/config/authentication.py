@@ -7,10 +7,94 @@ for single-user CLI tools with embedded servers.
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+
+from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_delete, post_save
 from rest_framework import authentication, exceptions
 
+# Seconds a resolved user stays cached. Signals clear the cache in the current
+# process; the TTL bounds how long other worker processes can serve a stale
+# user or a revoked token.
+PRINCIPAL_CACHE_TTL = 60
+
+# Cache key for the user resolved from the API_TOKEN setting
+API_TOKEN_CACHE_KEY = "api_token"
+
+
+def generate_api_token() -> str:
+    """Generate a secure API token."""
+    return secrets.token_urlsafe(32)
+
+
+def hash_token(token: str) -> str:
+    """
+    Hash a token for storage and lookup.
+
+    Tokens are long random strings, so a fast hash is sufficient and keeps
+    the per-request cost low.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class PrincipalCache:
+    """Thread-safe in-process cache of resolved users with a TTL."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Return a copy of the cached user, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if time.monotonic() >= expires_at:
+            return None
+        # Each request gets its own instance so per-request changes don't leak
+        return copy.copy(user)
+
+    def set(self, key: str, user) -> None:
+        """Cache a resolved user."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, user)
+
+    def clear(self, **kwargs) -> None:
+        """Clear all entries. Accepts signal arguments so it can be a receiver."""
+        with self._lock:
+            self._entries.clear()
+
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_TTL)
+
+
+def connect_principal_cache_signals(api_token_model=None) -> None:
+    """
+    Clear the principal cache when a user or API token is saved or deleted.
+
+    Called from the app's ready(), with the ApiToken model if the project
+    defines one.
+    """
+    senders = [settings.AUTH_USER_MODEL]
+    if api_token_model is not None:
+        senders.append(api_token_model)
+    for sender in senders:
+        for signal in (post_save, post_delete):
+            signal.connect(
+                principal_cache.clear, sender=sender, dispatch_uid="principal_cache"
+            )
+
 
 class SingleUserTokenAuthentication(authentication.BaseAuthentication):
     """
@@ -21,6 +105,11 @@ class SingleUserTokenAuthentication(authentication.BaseAuthentication):
 
     The token is validated against the API_TOKEN setting.
     If valid, returns the first user in the database (or creates one if none exists).
+
+    When the HASHED_API_TOKENS setting is enabled, tokens that don't match
+    API_TOKEN are also looked up by hash in the ApiToken table.
+
+    Resolved users are cached in-process, so a cached request runs no queries.
     """
 
     keyword = "Bearer"
@@ -51,18 +140,34 @@ class SingleUserTokenAuthentication(authentication.BaseAuthentication):
     def authenticate_token(self, token):
         """Validate the token and return the user."""
         expected_token = getattr(settings, "API_TOKEN", "")
+        hashed_tokens = getattr(settings, "HASHED_API_TOKENS", False)
 
-        if not expected_token:
+        if not expected_token and not hashed_tokens:
             msg = "API_TOKEN is not configured. Set the environment variable."
             raise exceptions.AuthenticationFailed(msg)
 
-        if token != expected_token:
-            msg = "Invalid token."
-            raise exceptions.AuthenticationFailed(msg)
+        if expected_token and hmac.compare_digest(
+            token.encode("utf-8"), expected_token.encode("utf-8")
+        ):
+            return (self.get_single_user(), token)
+
+        if hashed_tokens:
+            user = self.get_hashed_token_user(token)
+            if user is not None:
+                return (user, token)
+
+        msg = "Invalid token."
+        raise exceptions.AuthenticationFailed(msg)
+
+    def get_single_user(self):
+        """Return the single user, creating it if none exists."""
+        user = principal_cache.get(API_TOKEN_CACHE_KEY)
+        if user is not None:
+            return user
 
         # Get or create the single user
         User = get_user_model()
-        user = User.objects.first()
+        user = User.objects.order_by("pk").first()
 
         if user is None:
             user = User.objects.create_user(
@@ -71,7 +176,29 @@ class SingleUserTokenAuthentication(authentication.BaseAuthentication):
                 password=None,  # No password needed for token auth
             )
 
-        return (user, token)
+        principal_cache.set(API_TOKEN_CACHE_KEY, user)
+        return user
+
+    def get_hashed_token_user(self, token):
+        """Return the user owning the hashed token, or None if unknown."""
+        try:
+            ApiToken = apps.get_model("$${name_snake}_app", "ApiToken")
+        except LookupError:
+            msg = "HASHED_API_TOKENS requires an ApiToken model in $${name_snake}_app."
+            raise ImproperlyConfigured(msg) from None
+
+        key_hash = hash_token(token)
+        user = principal_cache.get(key_hash)
+        if user is not None:
+            return user
+
+        try:
+            api_token = ApiToken.objects.select_related("user").get(key_hash=key_hash)
+        except ApiToken.DoesNotExist:
+            return None
+
+        principal_cache.set(key_hash, api_token.user)
+        return api_token.user
 
     def authenticate_header(self, request):
         """Return a string to be used as the value of the WWW-Authenticate header."""
@@ -0,0 +1,93 @@
+"""
+Cache configuration for $${name_snake}.
+
+This module builds the CACHES setting. The backend is selected with the
+$${name_snake.upper()}_CACHE_BACKEND environment variable:
+
+- ``file`` (default): files in the data directory, shared by all worker
+  processes, with least-recently-used eviction.
+- ``memory``: per-process local memory with LRU eviction. Invalidation only
+  reaches the process that made the change, so the server refuses it with
+  more than one worker.
+- ``none``: caching disabled.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from django.core.cache.backends.filebased import FileBasedCache
+
+CACHE_BACKEND_ENV_VAR = "$${name_snake.upper()}_CACHE_BACKEND"
+CACHE_BACKENDS = {
+    "memory": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "$${name_snake}.config.cache.LRUFileBasedCache",
+    "none": "django.core.cache.backends.dummy.DummyCache",
+}
+DEFAULT_CACHE_BACKEND = "file"
+
+# Default TTL in seconds and maximum number of entries before eviction
+CACHE_TIMEOUT = 300
+CACHE_MAX_ENTRIES = 10_000
+
+
+class LRUFileBasedCache(FileBasedCache):
+    """
+    File-based cache that evicts the least recently used entries.
+
+    Django's FileBasedCache culls random entries. This backend bumps a file's
+    modification time on every hit and culls the oldest files first.
+    """
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, default, version)
+        if value is not default:
+            try:
+                os.utime(self._key_to_file(key, version))
+            except FileNotFoundError:
+                pass
+        return value
+
+    def _cull(self):
+        filelist = self._list_cache_files()
+        num_entries = len(filelist)
+        if num_entries < self._max_entries:
+            return
+        if self._cull_frequency == 0:
+            return self.clear()
+
+        def last_used(fname):
+            try:
+                return os.stat(fname).st_mtime
+            except FileNotFoundError:
+                return 0
+
+        filelist.sort(key=last_used)
+        for fname in filelist[: num_entries // self._cull_frequency]:
+            self._delete(fname)
+
+
+def get_cache_backend() -> str:
+    """Return the cache backend selected by the environment."""
+    return os.environ.get(CACHE_BACKEND_ENV_VAR, DEFAULT_CACHE_BACKEND).lower()
+
+
+def get_cache_config(data_dir: Path, backend: str | None = None) -> dict:
+    """Build the Django cache configuration for the selected backend."""
+    backend = (backend or get_cache_backend()).lower()
+    if backend not in CACHE_BACKENDS:
+        msg = (
+            f"Unknown cache backend {backend!r}. "
+            f"Set {CACHE_BACKEND_ENV_VAR} to one of: {', '.join(CACHE_BACKENDS)}."
+        )
+        raise ValueError(msg)
+
+    config = {
+        "BACKEND": CACHE_BACKENDS[backend],
+        "TIMEOUT": CACHE_TIMEOUT,
+        "OPTIONS": {"MAX_ENTRIES": CACHE_MAX_ENTRIES},
+    }
+    if backend == "file":
+        config["LOCATION"] = data_dir / "cache"
+    return {"default": config}
@@ -0,0 +1,39 @@
+"""
+Gunicorn server hooks for $${name_snake}.
+
+The server command loads this module with ``--config python:...``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+
+def _clean_exit_marker(pid: int) -> Path:
+    return Path(os.environ["PROMETHEUS_MULTIPROC_DIR"]) / f"clean-exit-{pid}"
+
+
+def worker_exit(server, worker):
+    """Leave a marker for the arbiter when the worker exits normally."""
+    # Gunicorn calls this while the worker's SystemExit propagates. Exit code
+    # 0 covers graceful shutdown and max-requests recycling; timeouts exit
+    # with 1, and workers that are killed or crash never get here.
+    error = sys.exc_info()[1]
+    if isinstance(error, SystemExit) and error.code in (0, None):
+        _clean_exit_marker(worker.pid).touch()
+
+
+def child_exit(server, worker):
+    """Drop the exited worker's live gauges and count abnormal exits."""
+    from prometheus_client import multiprocess
+
+    from $${name_snake}.config.metrics import WORKER_RESTARTS
+
+    multiprocess.mark_process_dead(worker.pid)
+    marker = _clean_exit_marker(worker.pid)
+    if marker.exists():
+        marker.unlink()
+    else:
+        WORKER_RESTARTS.inc()
@@ -0,0 +1,59 @@
+"""
+Health checks for $${name_snake}.
+
+This module provides the readiness probe and the checks behind it.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.db import DatabaseError, connection
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+# Seconds the database check may take before the server reports not ready.
+# SQLite waits up to its busy timeout on a locked database, which is much
+# longer than a probe should hang.
+READINESS_TIMEOUT = 2
+
+# A single thread, so a hung check makes the next ones time out instead of
+# piling up threads
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="readiness")
+
+
+def _query_database() -> None:
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM django_migrations LIMIT 1")
+            cursor.fetchone()
+    finally:
+        connection.close()
+
+
+def check_database(timeout: float = READINESS_TIMEOUT) -> str | None:
+    """Return None if the database answers a query in time, else the error."""
+    future = _executor.submit(_query_database)
+    try:
+        future.result(timeout=timeout)
+    except FutureTimeoutError:
+        return f"Database did not respond within {timeout}s."
+    except DatabaseError as e:
+        return f"Database error: {e}"
+    return None
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def readiness_view(request):
+    """Readiness probe: the database answers queries."""
+    error = check_database()
+    if error is not None:
+        return Response(
+            {"status": "unavailable", "database": error},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    return Response({"status": "ok", "database": "ok"}, status=status.HTTP_200_OK)
@@ -0,0 +1,97 @@
+"""
+Prometheus metrics for $${name_snake}.
+
+This module defines the request metrics recorded by MetricsMiddleware and the
+view that exposes them in the Prometheus text format.
+
+When PROMETHEUS_MULTIPROC_DIR is set (the server command does this), each
+gunicorn worker writes its samples to that directory and the metrics view
+aggregates them, so a scrape of any worker covers the whole server.
+"""
+
+from __future__ import annotations
+
+import os
+
+from django.http import HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROC_DIR_ENV_VAR = "PROMETHEUS_MULTIPROC_DIR"
+
+# Route label for requests that didn't resolve to a URL pattern, so 404s for
+# arbitrary paths don't create a series each
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUEST_LATENCY = Histogram(
+    "$${name_snake}_request_duration_seconds",
+    "Request latency by route.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+RESPONSES = Counter(
+    "$${name_snake}_responses_total",
+    "Responses by route and status code.",
+    ["method", "route", "status"],
+)
+
+REQUESTS_IN_FLIGHT = Gauge(
+    "$${name_snake}_requests_in_flight",
+    "Requests currently being handled.",
+    multiprocess_mode="livesum",
+)
+
+DB_QUERY_TIME = Histogram(
+    "$${name_snake}_db_query_duration_seconds",
+    "Total SQL time per request by route.",
+    ["route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+DB_QUERIES = Counter(
+    "$${name_snake}_db_queries_total",
+    "SQL queries run by route.",
+    ["route"],
+)
+
+RESPONSE_CACHE_LOOKUPS = Counter(
+    "$${name_snake}_response_cache_lookups",
+    "Response cache lookups by view and outcome (hits or misses).",
+    ["view", "outcome"],
+)
+
+WORKER_RESTARTS = Counter(
+    "$${name_snake}_worker_restarts_total",
+    "Gunicorn worker processes that crashed, timed out or were killed.",
+)
+
+
+def get_route(request) -> str:
+    """Return the URL pattern the request resolved to."""
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match is None or not resolver_match.route:
+        return UNMATCHED_ROUTE
+    return resolver_match.route
+
+
+def get_registry():
+    """Return a registry covering every worker process."""
+    if not os.environ.get(MULTIPROC_DIR_ENV_VAR):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def metrics_view(request):
+    """Expose metrics in the Prometheus text format."""
+    return HttpResponse(generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,255 @@
+"""
+Middleware for $${name_snake}.
+
+This module provides response compression with brotli and gzip negotiation,
+per-request SQL profiling and Prometheus request metrics.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import Counter
+
+import brotli
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+from $${name_snake}.config.metrics import (
+    DB_QUERIES,
+    DB_QUERY_TIME,
+    REQUEST_LATENCY,
+    REQUESTS_IN_FLIGHT,
+    RESPONSES,
+    get_route,
+)
+
+profile_logger = logging.getLogger("$${name_snake}.profile")
+
+re_accepts_brotli = _lazy_re_compile(r"\bbr\b")
+
+# Brotli quality for dynamic responses. Higher levels compress slightly
+# better but are far too slow to run per request.
+BROTLI_QUALITY = 4
+
+
+def _brotli_stream(chunks):
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    for chunk in chunks:
+        # Flush each chunk so clients receive data as soon as it is produced
+        if data := compressor.process(chunk) + compressor.flush():
+            yield data
+    yield compressor.finish()
+
+
+async def _abrotli_stream(chunks):
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    async for chunk in chunks:
+        if data := compressor.process(chunk) + compressor.flush():
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Compress responses with brotli if the client accepts it, else with gzip.
+
+    Streaming responses are compressed chunk by chunk, so they keep streaming.
+    Responses that already have a Content-Encoding (such as static files
+    served by WhiteNoise) are left alone.
+    """
+
+    def process_response(self, request, response):
+        ae = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if not re_accepts_brotli.search(ae):
+            return super().process_response(request, response)
+
+        # It's not worth attempting to compress really short responses.
+        if not response.streaming and len(response.content) < 200:
+            return response
+
+        if response.has_header("Content-Encoding"):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = _abrotli_stream(response.streaming_content)
+            else:
+                response.streaming_content = _brotli_stream(response.streaming_content)
+            del response.headers["Content-Length"]
+        else:
+            compressed_content = brotli.compress(response.content, quality=BROTLI_QUALITY)
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers["Content-Length"] = str(len(response.content))
+
+        # Compression changes the bytes, so a strong ETag must become weak
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+
+        return response
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when a view runs more queries than its budget allows."""
+
+
+def query_budget(max_queries: int):
+    """
+    Set the maximum number of queries a function view may run.
+
+    For viewsets and class-based views, set a ``query_budget`` class
+    attribute instead.
+
+    Usage:
+        @query_budget(5)
+        @api_view(["GET"])
+        def item_summary(request):
+            ...
+    """
+
+    def decorator(view_func):
+        view_func.query_budget = max_queries
+        return view_func
+
+    return decorator
+
+
+class RequestProfile:
+    """Execute wrapper that records every query run on a connection."""
+
+    def __init__(self):
+        self.sql_time = 0.0
+        self.query_count = 0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += time.perf_counter() - start
+            self.query_count += 1
+            # Statements are parameterized, so the same SQL repeated with
+            # different params usually means a query in a loop (N+1)
+            self.statements[sql] += 1
+
+    def duplicates(self, limit: int = 5) -> list[dict]:
+        """Return the most repeated statements."""
+        return [
+            {"sql": sql, "count": count}
+            for sql, count in self.statements.most_common(limit)
+            if count > 1
+        ]
+
+
+class QueryProfilingMiddleware:
+    """
+    Record query count, SQL time and repeated queries for each request.
+
+    Enabled by the PROFILE_REQUESTS setting (``server --profile`` or
+    $${name_snake.upper()}_PROFILE=true). Each response gets a Server-Timing
+    header, and a JSON line is logged to the "$${name_snake}.profile" logger.
+
+    Views that run more queries than their budget (a ``query_budget``
+    attribute, or the QUERY_BUDGET setting) are logged as warnings, and raise
+    QueryBudgetExceeded when QUERY_BUDGET_STRICT is set, which fails tests.
+
+    Queries run while a streaming response is iterated are not counted.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PROFILE_REQUESTS", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        budget = getattr(view_func, "query_budget", None)
+        if budget is None:
+            budget = getattr(getattr(view_func, "cls", None), "query_budget", None)
+        request.query_budget = budget
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        start = time.perf_counter()
+        with connection.execute_wrapper(profile):
+            response = self.get_response(request)
+        total_time = time.perf_counter() - start
+
+        response.headers["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={profile.sql_time * 1000:.1f};desc="{profile.query_count} queries"',
+                f"app;dur={(total_time - profile.sql_time) * 1000:.1f}",
+                f"total;dur={total_time * 1000:.1f}",
+            ]
+        )
+
+        budget = getattr(request, "query_budget", None)
+        if budget is None:
+            budget = getattr(settings, "QUERY_BUDGET", None)
+        over_budget = budget is not None and profile.query_count > budget
+
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "duration_ms": round(total_time * 1000, 1),
+            "queries": profile.query_count,
+            "sql_ms": round(profile.sql_time * 1000, 1),
+            "duplicates": profile.duplicates(),
+        }
+        if over_budget:
+            record["query_budget"] = budget
+            profile_logger.warning(json.dumps(record))
+            if getattr(settings, "QUERY_BUDGET_STRICT", False):
+                msg = (
+                    f"{request.method} {request.path} ran {profile.query_count} "
+                    f"queries, over its budget of {budget}."
+                )
+                raise QueryBudgetExceeded(msg)
+        else:
+            profile_logger.info(json.dumps(record))
+
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Record request latency, status codes, in-flight requests and SQL time.
+
+    Place it first in MIDDLEWARE so the latency covers the whole stack. The
+    metrics are exposed by config.metrics.metrics_view.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(profile):
+                response = self.get_response(request)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+        duration = time.perf_counter() - start
+
+        route = get_route(request)
+        REQUEST_LATENCY.labels(request.method, route).observe(duration)
+        RESPONSES.labels(request.method, route, response.status_code).inc()
+        DB_QUERY_TIME.labels(route).observe(profile.sql_time)
+        if profile.query_count:
+            DB_QUERIES.labels(route).inc(profile.query_count)
+
+        return response
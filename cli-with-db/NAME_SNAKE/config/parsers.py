@@ -0,0 +1,23 @@
+"""
+Parser classes for $${name_snake}.
+
+This module provides a JSON parser backed by orjson.
+"""
+
+from __future__ import annotations
+
+import orjson
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+
+class ORJSONParser(parsers.JSONParser):
+    """JSON parser backed by orjson. Request bodies must be UTF-8."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Parse the incoming JSON bytestream."""
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            msg = f"JSON parse error - {exc}"
+            raise ParseError(msg) from exc
@@ -0,0 +1,217 @@
+"""
+Response caching for $${name_snake}.
+
+This module provides the cache_response decorator, which caches the data of
+successful GET responses keyed by view, URL, query parameters and auth token,
+and the view that reports cache hits and misses. Hits and misses are counted
+in a Prometheus counter, so with PROMETHEUS_MULTIPROC_DIR set the stats cover
+every worker process.
+
+Cached entries are invalidated through per-model versions: each entry's key
+includes the current version of the models it depends on, and saving or
+deleting an instance of a model (post_save / post_delete) replaces that
+model's version, so older entries are never read again and expire by TTL or
+LRU eviction.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import threading
+import types
+import uuid
+
+from django.apps import apps
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpRequest
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .metrics import RESPONSE_CACHE_LOOKUPS, get_registry
+
+# Cache alias used for responses
+RESPONSE_CACHE_ALIAS = "default"
+
+# Response headers stored with the cached data
+CACHED_HEADERS = ("ETag", "Last-Modified")
+
+
+def _version_key(label: str) -> str:
+    return f"response-cache:version:{label}"
+
+
+def _model_label(model) -> str:
+    if isinstance(model, str):
+        model = apps.get_model(model)
+    return model._meta.concrete_model._meta.label
+
+
+def get_model_versions(labels: list[str]) -> list[str]:
+    """Return the current cache version of each model."""
+    cache = caches[RESPONSE_CACHE_ALIAS]
+    keys = [_version_key(label) for label in labels]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # A random initial version means an evicted version can never
+            # match entries written before the eviction
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def invalidate_model(model) -> None:
+    """Invalidate all cached responses that depend on the model."""
+    caches[RESPONSE_CACHE_ALIAS].set(
+        _version_key(_model_label(model)), uuid.uuid4().hex, timeout=None
+    )
+
+
+def _invalidate_on_change(sender, **kwargs):
+    invalidate_model(sender)
+
+
+_watched_models = set()
+_watched_lock = threading.Lock()
+
+
+def watch_model(model) -> None:
+    """
+    Invalidate cached responses for the model whenever an instance changes.
+
+    Receivers are connected per model rather than for all senders, so models
+    without cached responses keep Django's fast-delete path.
+    """
+    with _watched_lock:
+        if model in _watched_models:
+            return
+        _watched_models.add(model)
+    for signal in (post_save, post_delete):
+        signal.connect(_invalidate_on_change, sender=model, dispatch_uid="response_cache")
+
+
+def get_cache_stats() -> dict[str, dict[str, int]]:
+    """Return hit and miss counts per cached view across all workers."""
+    counts = {}
+    for metric in get_registry().collect():
+        if metric.name != RESPONSE_CACHE_LOOKUPS.describe()[0].name:
+            continue
+        for sample in metric.samples:
+            if sample.name.endswith("_total"):
+                key = (sample.labels["view"], sample.labels["outcome"])
+                counts[key] = counts.get(key, 0) + int(sample.value)
+    result = {}
+    for (view_name, outcome), count in sorted(counts.items()):
+        result.setdefault(view_name, {"hits": 0, "misses": 0})[outcome] = count
+    return result
+
+
+@api_view(["GET"])
+def cache_stats_view(request):
+    """Response cache hit and miss counts for the whole server."""
+    return Response(get_cache_stats(), status=status.HTTP_200_OK)
+
+
+def _record(view_name: str, outcome: str) -> None:
+    RESPONSE_CACHE_LOOKUPS.labels(view=view_name, outcome=outcome).inc()
+
+
+class _CachedView:
+    """A view function or method wrapped by cache_response."""
+
+    def __init__(self, func, timeout: int | None, models):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.timeout = timeout
+        self.models = models
+        self.view_name = f"{func.__module__}.{func.__qualname__}"
+        for model in models or ():
+            watch_model(model)
+
+    def __set_name__(self, owner, name):
+        # Watch a viewset's model when the class is defined, so every worker
+        # process invalidates on writes, even before serving this view
+        queryset = getattr(owner, "queryset", None)
+        if self.models is None and queryset is not None:
+            watch_model(queryset.model)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    def __call__(self, *args, **kwargs):
+        if isinstance(args[0], (Request, HttpRequest)):
+            view, request = None, args[0]
+        else:
+            view, request = args[0], args[1]
+
+        if request.method not in ("GET", "HEAD"):
+            return self.func(*args, **kwargs)
+
+        if self.models is not None:
+            labels = sorted(_model_label(model) for model in self.models)
+        else:
+            model = view.get_queryset().model
+            watch_model(model)
+            labels = [_model_label(model)]
+
+        cache = caches[RESPONSE_CACHE_ALIAS]
+        key_parts = [
+            self.view_name,
+            request.get_full_path(),
+            request.META.get("HTTP_AUTHORIZATION", ""),
+            *get_model_versions(labels),
+        ]
+        key = "response-cache:" + hashlib.sha256("\n".join(key_parts).encode()).hexdigest()
+
+        cached = cache.get(key)
+        if cached is not None:
+            _record(self.view_name, "hits")
+            data, headers = cached
+            response = Response(data, headers=headers)
+            response["X-Cache"] = "HIT"
+            return response
+
+        _record(self.view_name, "misses")
+        response = self.func(*args, **kwargs)
+        if isinstance(response, Response) and response.status_code == 200:
+            headers = {name: response[name] for name in CACHED_HEADERS if name in response}
+            cache.set(key, (response.data, headers), timeout=self.timeout)
+        response["X-Cache"] = "MISS"
+        return response
+
+
+def cache_response(timeout: int | None = None, models=None):
+    """
+    Cache successful GET responses of a view.
+
+    Works on DRF function views and on viewset/APIView methods. Dependencies
+    are given as model classes or "app_label.Model" labels; for viewsets they
+    default to the model of the viewset's queryset. Responses carry an
+    X-Cache header of HIT or MISS.
+
+    Usage:
+        class ItemViewSet(viewsets.ModelViewSet):
+            @cache_response(timeout=60)
+            def list(self, request, *args, **kwargs):
+                return super().list(request, *args, **kwargs)
+
+        @api_view(["GET"])
+        @cache_response(models=["$${name_snake}_app.Item"])
+        def item_summary(request):
+            ...
+
+    Args:
+        timeout: TTL in seconds. Defaults to the cache's TIMEOUT.
+        models: Models whose changes invalidate the cached responses.
+    """
+
+    def decorator(func):
+        return _CachedView(func, timeout, models)
+
+    return decorator
@@ -7,7 +7,48 @@ in your application's serializers.
 
 from __future__ import annotations
 
-from rest_framework import serializers
+from operator import attrgetter
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import ISO_8601, fields, relations, serializers
+from rest_framework.settings import api_settings
+
+# Field representations that return database values unchanged
+_IDENTITY_REPRESENTATIONS = {
+    fields.BooleanField.to_representation,
+    fields.CharField.to_representation,
+    fields.FloatField.to_representation,
+    fields.IntegerField.to_representation,
+    fields.ReadOnlyField.to_representation,
+}
+
+
+def _datetime_converter(field: fields.DateTimeField):
+    """
+    Return a converter matching DateTimeField's ISO 8601 output.
+
+    DateTimeField looks up the current timezone for every value; this resolves
+    it once per list instead.
+    """
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    field_timezone = (
+        field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    )
+    if (
+        output_format is None
+        or output_format.lower() != ISO_8601
+        or field_timezone is None
+    ):
+        return field.to_representation
+
+    def convert(value):
+        if isinstance(value, str) or value.tzinfo is None:
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+    return convert
 
 
 class TimestampedModelSerializer(serializers.ModelSerializer):
@@ -35,3 +76,129 @@ class ReadOnlyModelSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         msg = "This serializer is read-only."
         raise NotImplementedError(msg)
+
+
+class ValuesListSerializer(serializers.ListSerializer):
+    """
+    List serializer that builds representations directly from column values.
+
+    On the first use for a serializer class, the child's fields are compiled
+    into a plan of (name, column, converter factory) entries. The plan holds
+    no field objects; each serializer builds its converters from its own bound
+    fields, so context such as the request is never shared between uses.
+    Querysets are then fetched with values_list() and turned into dicts without
+    creating model instances or walking DRF fields per row. Lists of
+    instances, such as a paginated page, read the planned attributes directly.
+
+    Serializers with fields that need the full DRF machinery (nested
+    serializers, method fields, dotted sources, non-pk related fields, file
+    fields, a custom get_fields or to_representation) fall back to the
+    standard path.
+
+    Opt in per serializer:
+        class ItemSerializer(ReadOnlyModelSerializer):
+            class Meta:
+                model = Item
+                fields = ["id", "name", "created_at"]
+                list_serializer_class = ValuesListSerializer
+    """
+
+    _plans = {}
+
+    def to_representation(self, data):
+        plan = self.get_plan()
+        if plan is None:
+            return super().to_representation(data)
+
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+
+        names = [name for name, _, _ in plan]
+        readable_fields = {field.field_name: field for field in self.child._readable_fields}
+        if list(readable_fields) != names:
+            # Fields were added or removed on this instance, e.g. in __init__
+            return super().to_representation(data)
+        converters = [
+            (index, make_converter(readable_fields[name]))
+            for index, (name, _, make_converter) in enumerate(plan)
+            if make_converter is not None
+        ]
+
+        columns = [column for _, column, _ in plan]
+        if isinstance(data, models.QuerySet) and data._result_cache is None:
+            rows = data.values_list(*columns).iterator()
+        else:
+            data = list(data)
+            model = self.child.Meta.model
+            if not all(isinstance(item, model) for item in data):
+                return super().to_representation(data)
+            rows = map(attrgetter(*columns), data)
+            if len(plan) == 1:
+                rows = ((value,) for value in rows)
+
+        if not converters:
+            return [dict(zip(names, row, strict=True)) for row in rows]
+
+        result = []
+        for row in rows:
+            row = list(row)
+            for index, converter in converters:
+                if row[index] is not None:
+                    row[index] = converter(row[index])
+            result.append(dict(zip(names, row, strict=True)))
+        return result
+
+    def get_plan(self):
+        """Return the compiled plan for the child serializer, or None."""
+        child_class = type(self.child)
+        if child_class not in self._plans:
+            self._plans[child_class] = self.compile_plan()
+        return self._plans[child_class]
+
+    def compile_plan(self):
+        """Map each readable field to a model column, or return None."""
+        child_class = type(self.child)
+        if (
+            child_class.to_representation is not serializers.Serializer.to_representation
+            or child_class.get_fields is not serializers.ModelSerializer.get_fields
+        ):
+            return None
+
+        model = self.child.Meta.model
+        plan = []
+        for field in self.child._readable_fields:
+            if len(field.source_attrs) != 1 or field.source == "*":
+                return None
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                return None
+            if (
+                not model_field.concrete
+                or model_field.many_to_many
+                or isinstance(model_field, models.FileField)
+                or isinstance(field, fields.FileField)
+            ):
+                # values_list() returns file names as str, not FieldFile
+                return None
+
+            if model_field.is_relation:
+                if not isinstance(field, relations.PrimaryKeyRelatedField) or field.pk_field:
+                    return None
+                # The pk is read from the <name>_id column without a join
+                make_converter = None
+            elif isinstance(field, (serializers.BaseSerializer, relations.RelatedField)):
+                return None
+            elif type(field).to_representation in _IDENTITY_REPRESENTATIONS:
+                make_converter = None
+            elif (
+                type(field).to_representation is fields.DateTimeField.to_representation
+                and type(field).enforce_timezone is fields.DateTimeField.enforce_timezone
+            ):
+                make_converter = _datetime_converter
+            else:
+                make_converter = attrgetter("to_representation")
+
+            plan.append((field.field_name, model_field.attname, make_converter))
+
+        return plan
@@ -7,8 +7,368 @@ in your application's views.
 
 from __future__ import annotations
 
-from rest_framework import viewsets
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count, Max
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import mixins, serializers, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.serializers import raise_errors_on_nested_writes
+
+from $${name_snake}.config.renderers import dumps
+from $${name_snake}.config.response_cache import invalidate_model
+
+# Field used to derive ETag and Last-Modified headers, as on TimestampedModel
+LAST_MODIFIED_FIELD = "updated_at"
+
+
+def conditional_response(
+    request,
+    etag: str | None,
+    last_modified: datetime | None,
+    get_response: Callable[[], Response],
+):
+    """
+    Return 304 Not Modified if the client's copy is current.
+
+    get_response is only called, and the serializer only run, when the client
+    needs a full body. ETag and Last-Modified headers are added either way.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = get_response()
+
+    if response.status_code in (200, 304):
+        if etag:
+            response.headers.setdefault("ETag", etag)
+        if timestamp is not None:
+            response.headers.setdefault("Last-Modified", http_date(timestamp))
+    return response
+
+
+def get_instance_etag(instance, last_modified: datetime) -> str:
+    """Return a weak ETag for a model instance."""
+    return "W/" + quote_etag(f"{instance.pk}-{last_modified.timestamp()}")
+
+
+async def _aiter_sync(iterator: Iterator[bytes]):
+    """Iterate a sync iterator from async code, one item per thread hop."""
+    sentinel = object()
+    while (chunk := await sync_to_async(next)(iterator, sentinel)) is not sentinel:
+        yield chunk
+
+
+def streaming_json_response(request, chunks: Iterator[bytes]) -> StreamingHttpResponse:
+    """
+    Stream JSON chunks to the client.
+
+    Under ASGI the chunks are produced in a worker thread and sent as they are
+    ready; Django would otherwise consume a sync iterator fully before sending.
+    """
+    if isinstance(getattr(request, "_request", request), ASGIRequest):
+        chunks = _aiter_sync(chunks)
+    return StreamingHttpResponse(chunks, content_type="application/json")
+
+
+class StreamingListMixin:
+    """
+    Mixin for model viewsets that streams unpaginated list responses.
+
+    The queryset is read with .iterator() and serialized in chunks of
+    ``stream_chunk_size`` rows, so memory per request stays flat as the table
+    grows and the first bytes are sent before the last rows are read.
+    Paginated requests use the standard list response.
+
+    Usage:
+        class ItemViewSet(StreamingListMixin, viewsets.ModelViewSet):
+            ...
+    """
+
+    stream_chunk_size = 1000
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        return streaming_json_response(request, self.iter_list_json(queryset))
+
+    def iter_list_json(self, queryset) -> Iterator[bytes]:
+        """Yield the JSON array for the queryset, one chunk of rows at a time."""
+        yield b"["
+        rows = queryset.iterator(chunk_size=self.stream_chunk_size)
+        separator = b""
+        while chunk := list(islice(rows, self.stream_chunk_size)):
+            body = dumps(self.get_serializer(chunk, many=True).data)
+            # Strip the enclosing brackets so chunks join into one array
+            yield separator + body[1:-1]
+            separator = b","
+        yield b"]"
+
+
+class ConditionalGetMixin:
+    """
+    Mixin for model viewsets that answers conditional GETs with 304.
+
+    ETag and Last-Modified are derived from the ``updated_at`` field of
+    TimestampedModel. Retrieve compares against the object's timestamp, and
+    list compares against an aggregate ETag (row count and latest timestamp)
+    that the database computes in a single query. Lists get no Last-Modified,
+    since deleting a row other than the newest doesn't change it.
+
+    Usage:
+        class ItemViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
+            ...
+    """
+
+    last_modified_field = LAST_MODIFIED_FIELD
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        last_modified = getattr(instance, self.last_modified_field)
+        return conditional_response(
+            request,
+            get_instance_etag(instance, last_modified),
+            last_modified,
+            lambda: Response(self.get_serializer(instance).data),
+        )
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        version = queryset.aggregate(
+            count=Count("pk"), last_modified=Max(self.last_modified_field)
+        )
+        last_modified = version["last_modified"]
+        timestamp = last_modified.timestamp() if last_modified else ""
+        return conditional_response(
+            request,
+            "W/" + quote_etag(f"{version['count']}-{timestamp}"),
+            None,
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+
+class BulkModelMixin:
+    """
+    Mixin for model viewsets that adds a ``bulk/`` endpoint.
+
+    - POST a list of objects to create them with bulk_create.
+    - PATCH a list of partial objects, each with an ``id``, to update them
+      with bulk_update.
+    - DELETE a list of ids to delete them.
+
+    All items are validated before anything is written, and writes run in a
+    single transaction. If any item is invalid, nothing is written and the
+    response lists the errors by item index. Updates and deletes check the
+    object permissions of every object first. auto_now fields such as
+    ``updated_at`` are set on update, since bulk_update skips them.
+
+    Creates use bulk_create unless the viewset overrides perform_create, the
+    serializer overrides create, or an item sets many-to-many fields; those
+    go through perform_create like a single create, one query per object.
+    Likewise, deletes run as one query unless the viewset overrides
+    perform_destroy, which is then called for each object.
+
+    bulk_create and bulk_update don't send post_save signals, so cached
+    responses for the model are invalidated explicitly. Bulk updates don't
+    support many-to-many fields.
+
+    Usage:
+        class ItemViewSet(BulkModelMixin, viewsets.ModelViewSet):
+            ...
+    """
+
+    # Maximum number of items accepted in one request
+    bulk_max_items = 1000
+    # Number of rows written per query
+    bulk_batch_size = 500
+
+    @action(detail=False, methods=["post", "patch", "delete"], url_path="bulk")
+    def bulk(self, request, *args, **kwargs):
+        """Create, update or delete a list of objects in one transaction."""
+        items = request.data
+        if not isinstance(items, list):
+            return Response(
+                {"detail": "Expected a list of items."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > self.bulk_max_items:
+            return Response(
+                {"detail": f"At most {self.bulk_max_items} items are allowed per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if request.method == "POST":
+            return self.bulk_create(items)
+        if request.method == "PATCH":
+            return self.bulk_update(items)
+        return self.bulk_destroy(items)
+
+    def bulk_create(self, items: list):
+        """Validate and create all items."""
+        serializer = self.get_serializer(data=items, many=True)
+        if not serializer.is_valid():
+            errors = serializer.errors
+            # Newer DRF versions key list errors by index instead of position
+            pairs = errors.items() if isinstance(errors, dict) else enumerate(errors)
+            return self.bulk_error_response(
+                (index, item_errors) for index, item_errors in pairs if item_errors
+            )
+
+        if not self.can_bulk_create(serializer):
+            with transaction.atomic():
+                self.perform_create(serializer)
+            data = self.get_serializer(serializer.instance, many=True).data
+            return Response(data, status=status.HTTP_201_CREATED)
+
+        model = self.get_queryset().model
+        for data in serializer.validated_data:
+            raise_errors_on_nested_writes("create", serializer.child, data)
+        instances = [model(**data) for data in serializer.validated_data]
+        with transaction.atomic():
+            model._default_manager.bulk_create(instances, batch_size=self.bulk_batch_size)
+        invalidate_model(model)
+
+        data = self.get_serializer(instances, many=True).data
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def can_bulk_create(self, serializer) -> bool:
+        """Whether validated items can be written with bulk_create."""
+        m2m_fields = {field.name for field in self.get_queryset().model._meta.many_to_many}
+        return (
+            type(self).perform_create is mixins.CreateModelMixin.perform_create
+            and type(serializer).create is serializers.ListSerializer.create
+            and type(serializer.child).create is serializers.ModelSerializer.create
+            and not any(m2m_fields.intersection(data) for data in serializer.validated_data)
+        )
+
+    def bulk_update(self, items: list):
+        """Validate all items against their objects and update them."""
+        queryset = self.get_queryset()
+        model = queryset.model
+        ids, errors = self.get_bulk_ids(items)
+        instances = queryset.in_bulk([pk for pk in ids if pk is not None])
+        m2m_fields = {field.name for field in model._meta.many_to_many}
+
+        updated = []
+        update_fields = set()
+        for index, (item, pk) in enumerate(zip(items, ids, strict=True)):
+            if pk is None:
+                continue
+            instance = instances.get(pk)
+            if instance is None:
+                errors.append((index, {"id": ["Not found."]}))
+                continue
+            self.check_object_permissions(self.request, instance)
+
+            serializer = self.get_serializer(instance, data=item, partial=True)
+            if not serializer.is_valid():
+                errors.append((index, serializer.errors))
+                continue
+            if unsupported := m2m_fields.intersection(serializer.validated_data):
+                errors.append(
+                    (index, {name: ["Not supported in bulk requests."] for name in unsupported})
+                )
+                continue
+
+            for attr, value in serializer.validated_data.items():
+                setattr(instance, attr, value)
+                update_fields.add(attr)
+            updated.append(instance)
+
+        if errors:
+            return self.bulk_error_response(errors)
+
+        # bulk_update doesn't call pre_save, so set auto_now fields here
+        now = timezone.now()
+        for field in model._meta.concrete_fields:
+            if getattr(field, "auto_now", False):
+                for instance in updated:
+                    setattr(instance, field.attname, now)
+                update_fields.add(field.name)
+
+        if updated and update_fields:
+            with transaction.atomic():
+                model._default_manager.bulk_update(
+                    updated, sorted(update_fields), batch_size=self.bulk_batch_size
+                )
+            invalidate_model(model)
+
+        return Response(self.get_serializer(updated, many=True).data)
+
+    def bulk_destroy(self, items: list):
+        """Delete all listed objects."""
+        ids, errors = self.get_bulk_ids(items)
+        queryset = self.get_queryset().filter(pk__in=[pk for pk in ids if pk is not None])
+
+        with transaction.atomic():
+            instances = queryset.in_bulk()
+            errors.extend(
+                (index, {"id": ["Not found."]})
+                for index, pk in enumerate(ids)
+                if pk is not None and pk not in instances
+            )
+            if errors:
+                return self.bulk_error_response(errors)
+            for instance in instances.values():
+                self.check_object_permissions(self.request, instance)
+            if type(self).perform_destroy is mixins.DestroyModelMixin.perform_destroy:
+                queryset.delete()
+            else:
+                for instance in instances.values():
+                    self.perform_destroy(instance)
+
+        return Response({"deleted": len(instances)})
+
+    def get_bulk_ids(self, items: list) -> tuple[list, list]:
+        """
+        Extract primary keys from items, which are objects with an ``id`` or ids.
+
+        Returns the ids (None where invalid) and a list of (index, errors).
+        """
+        pk_field = self.get_queryset().model._meta.pk
+        ids = []
+        errors = []
+        seen = set()
+        for index, item in enumerate(items):
+            value = item.get("id") if isinstance(item, dict) else item
+            try:
+                pk = pk_field.to_python(value)
+            except ValidationError:
+                pk = None
+            if pk is None:
+                errors.append((index, {"id": ["A valid id is required."]}))
+            elif pk in seen:
+                errors.append((index, {"id": ["Duplicate id."]}))
+                pk = None
+            else:
+                seen.add(pk)
+            ids.append(pk)
+        return ids, errors
+
+    def bulk_error_response(self, errors):
+        """Return a 400 response listing errors by item index."""
+        return Response(
+            {
+                "errors": [
+                    {"index": index, "errors": item_errors}
+                    for index, item_errors in sorted(errors, key=lambda error: error[0])
+                ]
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
 
 class SingleObjectViewSet(viewsets.ViewSet):
@@ -17,9 +377,13 @@ class SingleObjectViewSet(viewsets.ViewSet):
 
     Useful for settings, profile, or other singleton-type resources.
     Override get_object() to return your singleton instance.
+
+    If the object has an ``updated_at`` field, retrieve answers conditional
+    GETs with 304 Not Modified.
     """
 
     serializer_class = None
+    last_modified_field = LAST_MODIFIED_FIELD
 
     def get_object(self):
         """Override this method to return the singleton object."""
@@ -38,8 +402,16 @@ class SingleObjectViewSet(viewsets.ViewSet):
     def retrieve(self, request, *args, **kwargs):
         """Retrieve the singleton object."""
         instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        last_modified = getattr(instance, self.last_modified_field, None)
+        if last_modified is None:
+            return Response(self.get_serializer(instance).data)
+
+        return conditional_response(
+            request,
+            get_instance_etag(instance, last_modified),
+            last_modified,
+            lambda: Response(self.get_serializer(instance).data),
+        )
 
     def update(self, request, *args, **kwargs):
         """Update the singleton object."""
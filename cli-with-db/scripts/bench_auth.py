@@ -0,0 +1,61 @@
+"""
+Benchmark per-request cost of SingleUserTokenAuthentication for $${name_snake}.
+
+Authenticates a bearer-token request repeatedly and reports the time and
+number of SQL queries per call, with the principal cache cold and warm.
+
+Usage:
+    python scripts/bench_auth.py --iterations 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=10_000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("$${name_snake.upper()}_DATA_DIR", tempfile.mkdtemp())
+
+    from $${name_snake}.cli.utils import run_migrations, setup_django_environment
+
+    env_vars = setup_django_environment()
+    run_migrations()
+
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIRequestFactory
+
+    from $${name_snake}.config.authentication import (
+        SingleUserTokenAuthentication,
+        principal_cache,
+    )
+
+    token = env_vars["$${name_snake.upper()}_API_TOKEN"]
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    auth = SingleUserTokenAuthentication()
+
+    print(f"{'cache':<6} {'us/call':>9} {'queries/call':>13}")
+    for label, clear_cache in (("cold", True), ("warm", False)):
+        auth.authenticate(request)
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            for _ in range(args.iterations):
+                if clear_cache:
+                    principal_cache.clear()
+                auth.authenticate(request)
+            elapsed = time.perf_counter() - start
+        print(
+            f"{label:<6} {elapsed / args.iterations * 1e6:>9.1f} "
+            f"{len(queries) / args.iterations:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
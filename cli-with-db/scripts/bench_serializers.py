@@ -0,0 +1,93 @@
+"""
+Benchmark list serialization for $${name_snake}.
+
+Serializes a table of users with the stock ReadOnlyModelSerializer and with
+ValuesListSerializer, checks that both produce the same output and reports
+the time each takes.
+
+Usage:
+    python scripts/bench_serializers.py --rows 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    os.environ.setdefault("$${name_snake.upper()}_DATA_DIR", tempfile.mkdtemp())
+
+    from $${name_snake}.cli.utils import run_migrations, setup_django_environment
+
+    setup_django_environment()
+    run_migrations()
+
+    from django.contrib.auth import get_user_model
+    from django.utils import timezone
+
+    from $${name_snake}.config.serializers import (
+        ReadOnlyModelSerializer,
+        ValuesListSerializer,
+    )
+
+    User = get_user_model()
+    user_fields = [
+        "id",
+        "username",
+        "email",
+        "first_name",
+        "is_active",
+        "is_staff",
+        "date_joined",
+        "last_login",
+    ]
+
+    class StockSerializer(ReadOnlyModelSerializer):
+        class Meta:
+            model = User
+            fields = user_fields
+
+    class FastSerializer(ReadOnlyModelSerializer):
+        class Meta:
+            model = User
+            fields = user_fields
+            list_serializer_class = ValuesListSerializer
+
+    now = timezone.now()
+    User.objects.bulk_create(
+        (
+            User(username=f"user{i}", email=f"user{i}@example.com", last_login=now)
+            for i in range(max(args.rows))
+        ),
+        batch_size=5000,
+    )
+
+    print(f"{'rows':>8} {'stock (s)':>10} {'fast (s)':>10} {'speedup':>8}")
+    for rows in args.rows:
+        queryset = User.objects.order_by("pk")[:rows]
+        timings = {}
+        outputs = {}
+        for label, serializer_class in (("stock", StockSerializer), ("fast", FastSerializer)):
+            start = time.perf_counter()
+            outputs[label] = serializer_class(queryset.all(), many=True).data
+            timings[label] = time.perf_counter() - start
+
+        if outputs["stock"] != outputs["fast"]:
+            msg = "Fast serializer output differs from the stock serializer."
+            raise AssertionError(msg)
+
+        print(
+            f"{rows:>8} {timings['stock']:>10.2f} {timings['fast']:>10.2f} "
+            f"{timings['stock'] / timings['fast']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark SQLite read/write throughput for the $${name_snake} database profiles.
+
+Each worker process opens its own connection the way Django does for the
+selected profile and runs a mixed workload of point reads and small write
+transactions against a scratch database.
+
+Usage:
+    python scripts/bench_sqlite.py --workers 1 4 8 --seconds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from $${name_snake}.config.database import (
+    DB_PROFILES,
+    SQLITE_BUSY_TIMEOUT,
+    get_sqlite_init_command,
+)
+
+SEED_ROWS = 10_000
+# Default sqlite3 timeout, which Django uses when no timeout option is set.
+BASIC_TIMEOUT = 5
+
+
+def connect(db_path: Path, profile: str) -> tuple[sqlite3.Connection, str]:
+    """Open a connection configured like Django would for the profile."""
+    if profile == "basic":
+        conn = sqlite3.connect(db_path, timeout=BASIC_TIMEOUT, isolation_level=None)
+        return conn, "BEGIN"
+
+    conn = sqlite3.connect(db_path, timeout=SQLITE_BUSY_TIMEOUT, isolation_level=None)
+    for command in get_sqlite_init_command().split(";"):
+        conn.execute(command)
+    return conn, "BEGIN IMMEDIATE"
+
+
+def create_database(db_path: Path, profile: str) -> None:
+    """Create and seed the scratch table."""
+    conn, _ = connect(db_path, profile)
+    if profile == "basic":
+        conn.execute("PRAGMA journal_mode=DELETE")
+    conn.execute(
+        "CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT, counter INTEGER)"
+    )
+    conn.execute("BEGIN")
+    conn.executemany(
+        "INSERT INTO item (name, counter) VALUES (?, 0)",
+        ((f"item-{i}",) for i in range(SEED_ROWS)),
+    )
+    conn.execute("COMMIT")
+    conn.close()
+
+
+def run_worker(db_path: Path, profile: str, seconds: float, write_ratio: float, results):
+    """Run the mixed workload until the deadline and report counts."""
+    conn, begin = connect(db_path, profile)
+    reads = writes = errors = 0
+    deadline = time.perf_counter() + seconds
+
+    while time.perf_counter() < deadline:
+        item_id = random.randint(1, SEED_ROWS)
+        try:
+            if random.random() < write_ratio:
+                # Read-then-write, like a typical update view
+                conn.execute(begin)
+                conn.execute("SELECT counter FROM item WHERE id = ?", (item_id,))
+                conn.execute(
+                    "UPDATE item SET counter = counter + 1 WHERE id = ?", (item_id,)
+                )
+                conn.execute("COMMIT")
+                writes += 1
+            else:
+                conn.execute(
+                    "SELECT id, name, counter FROM item WHERE id = ?", (item_id,)
+                ).fetchone()
+                reads += 1
+        except sqlite3.OperationalError:
+            errors += 1
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+
+    conn.close()
+    results.put((reads, writes, errors))
+
+
+def run_benchmark(profile: str, workers: int, seconds: float, write_ratio: float) -> dict:
+    """Run one benchmark configuration and return throughput figures."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.sqlite3"
+        create_database(db_path, profile)
+
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=run_worker,
+                args=(db_path, profile, seconds, write_ratio, results),
+            )
+            for _ in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        totals = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+    reads, writes, errors = (sum(column) for column in zip(*totals, strict=True))
+    return {
+        "reads_per_sec": reads / seconds,
+        "writes_per_sec": writes / seconds,
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument(
+        "--write-ratio",
+        type=float,
+        default=0.2,
+        help="Fraction of operations that are write transactions.",
+    )
+    parser.add_argument("--profiles", nargs="+", default=list(DB_PROFILES[::-1]))
+    args = parser.parse_args()
+
+    print(f"{'profile':<12} {'workers':>7} {'reads/s':>10} {'writes/s':>10} {'errors':>7}")
+    for profile in args.profiles:
+        for workers in args.workers:
+            result = run_benchmark(profile, workers, args.seconds, args.write_ratio)
+            print(
+                f"{profile:<12} {workers:>7} {result['reads_per_sec']:>10.0f} "
+                f"{result['writes_per_sec']:>10.0f} {result['errors']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,4 @@
-from config.admin import auto_register_models
-
 from . import models
+from .admin_utils import auto_register_models
 
 auto_register_models(models)
@@ -0,0 +1,207 @@
+"""
+Admin registration for $${name_snake}.
+
+auto_register_models() registers every model in a module with an admin that
+stays fast on large tables:
+
+- Unfiltered changelists use the database's row estimate instead of COUNT(*),
+  and filtered ones count at most FILTERED_COUNT_LIMIT rows.
+- Foreign keys shown in list_display are joined with list_select_related,
+  instead of Django's default of following every foreign key.
+- Deep pages fetch the page's primary keys first and then only those rows,
+  so the offset is walked over the narrow key column.
+- Rows are listed newest first, unless the admin or the model's Meta sets
+  an ordering.
+- Foreign key widgets use autocomplete when the related admin has
+  search_fields, and a raw id input otherwise, instead of a select holding
+  every row.
+"""
+
+from __future__ import annotations
+
+import inspect
+
+from django.contrib import admin
+from django.contrib.admin import widgets
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import Paginator
+from django.db import connections, models
+from django.db.models import Max
+from django.utils.functional import cached_property
+
+# Tables estimated below this many rows are counted exactly
+ESTIMATE_THRESHOLD = 100_000
+
+# Filtered changelists stop counting after this many rows
+FILTERED_COUNT_LIMIT = 100_000
+
+# Pages starting past this offset fetch primary keys before rows
+DEFERRED_JOIN_OFFSET = 1000
+
+# Columns shown by default, after the primary key
+MAX_LIST_DISPLAY = 6
+
+# Field types that make poor changelist columns
+_SKIPPED_LIST_FIELDS = (models.TextField, models.JSONField, models.BinaryField)
+
+
+def estimate_row_count(model, using: str) -> int | None:
+    """Return a cheap estimate of a table's row count, or None if unavailable."""
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 until the table has been analyzed
+        if row is not None and row[0] >= 0:
+            return row[0]
+        return None
+
+    if isinstance(model._meta.pk, models.AutoField):
+        # The highest auto-increment key is an index lookup; deleted rows make
+        # it an overestimate
+        return model._default_manager.using(using).aggregate(max_pk=Max("pk"))["max_pk"] or 0
+    return None
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that avoids full-table counts and deep row offsets."""
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimate_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= ESTIMATE_THRESHOLD:
+                return estimate
+            return queryset.count()
+        return queryset[:FILTERED_COUNT_LIMIT].count()
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        # Ordering by a joined column can repeat keys in a distinct queryset
+        if bottom < DEFERRED_JOIN_OFFSET or self.object_list.query.distinct:
+            return super().page(number)
+
+        pks = list(
+            self.object_list.values_list("pk", flat=True)[bottom : bottom + self.per_page]
+        )
+        positions = {pk: index for index, pk in enumerate(pks)}
+        rows = sorted(
+            self.object_list.filter(pk__in=pks), key=lambda row: positions[row.pk]
+        )
+        return self._get_page(rows, number, self)
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """ModelAdmin defaults for tables too large to count or list in full."""
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 100
+
+    def get_ordering(self, request):
+        # Newest first, unless the admin or the model orders rows itself
+        if self.ordering or self.model._meta.ordering:
+            return super().get_ordering(request)
+        return ("-pk",)
+
+    def get_list_select_related(self, request):
+        if self.list_select_related is not False:
+            return self.list_select_related
+        related = []
+        for name in self.get_list_display(request):
+            if not isinstance(name, str):
+                continue
+            try:
+                field = self.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if field.many_to_one or field.one_to_one:
+                related.append(name)
+        # An empty list keeps Django from following every foreign key
+        return related
+
+    def get_autocomplete_fields(self, request):
+        if self.autocomplete_fields:
+            return self.autocomplete_fields
+        return [
+            field.name
+            for field in self.model._meta.get_fields()
+            if (field.many_to_one or field.one_to_one)
+            and field.concrete
+            and field.editable
+            and self._has_search_fields(field.related_model)
+        ]
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if (
+            "widget" not in kwargs
+            and db_field.name not in self.get_autocomplete_fields(request)
+            and db_field.name not in self.radio_fields
+        ):
+            kwargs["widget"] = widgets.ForeignKeyRawIdWidget(
+                db_field.remote_field, self.admin_site, using=kwargs.get("using")
+            )
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+    def _has_search_fields(self, model) -> bool:
+        related_admin = self.admin_site._registry.get(model)
+        return related_admin is not None and bool(related_admin.search_fields)
+
+
+def get_default_list_display(model) -> list[str]:
+    """Return the primary key and the first few simple fields."""
+    names = [model._meta.pk.name]
+    for field in model._meta.fields:
+        if len(names) > MAX_LIST_DISPLAY:
+            break
+        if field.primary_key or isinstance(field, _SKIPPED_LIST_FIELDS):
+            continue
+        names.append(field.name)
+    return names
+
+
+def get_default_search_fields(model) -> list[str]:
+    """Return the model's short text fields."""
+    return [
+        field.name
+        for field in model._meta.fields
+        if isinstance(field, models.CharField) and not field.choices
+    ][:3]
+
+
+def auto_register_models(models_module, admin_site=admin.site, admin_class=LargeTableAdmin):
+    """
+    Register every concrete model defined in a models module.
+
+    Models that are already registered are skipped, so custom admins can be
+    registered before calling this.
+
+    Usage:
+        from . import models
+
+        auto_register_models(models)
+    """
+    for _, model in inspect.getmembers(models_module, inspect.isclass):
+        if (
+            not issubclass(model, models.Model)
+            or model.__module__ != models_module.__name__
+            or model._meta.abstract
+            or model._meta.proxy
+            or admin_site.is_registered(model)
+        ):
+            continue
+        model_admin = type(
+            f"{model.__name__}Admin",
+            (admin_class,),
+            {
+                "list_display": get_default_list_display(model),
+                "search_fields": get_default_search_fields(model),
+            },
+        )
+        admin_site.register(model, model_admin)
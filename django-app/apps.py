@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class $${name_pascal}Config(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "$${parent_package_name}.$${name_snake}"
+
+    def ready(self):
+        # Registers broadcast topics, so writes from every process reach
+        # subscribers (see broadcast.py)
+        from . import routing  # noqa: F401
@@ -0,0 +1,391 @@
+"""
+Websocket broadcasting for $${name_snake}.
+
+Clients subscribe to topics through TopicConsumer (see routing.py). A topic is
+a queryset, or a plain name for events published with broadcaster.publish().
+Each committed save or delete of a topic's model is sent to the topic's group
+from the process that made it, be it an HTTP worker, a management command or
+a task worker; a transaction's changes are sent together when it commits. Every process with subscribers collects the changes for one
+tick, coalesces them per object, serializes them once per topic and sends
+them to its subscribers with a single group_send.
+
+Register topics next to the websocket routes in routing.py, which the app
+loads at startup so every process knows them:
+
+    from $${parent_package_name}.$${name_snake}.broadcast import register_topic
+
+    register_topic("open-orders", Order.objects.filter(status="open"), OrderSerializer)
+    register_topic("imports")  # broadcaster.publish("imports", {...})
+
+Use BroadcastChannelLayer for the in-process layer. Swapping it for a
+networked layer (e.g. channels_redis) in CHANNEL_LAYERS reaches subscribers
+connected to other processes:
+
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "$${parent_package_name}.$${name_snake}.broadcast.BroadcastChannelLayer",
+            "CONFIG": {"capacity": 100},
+        },
+    }
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+import weakref
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+
+from asgiref.sync import async_to_sync
+from channels.db import database_sync_to_async
+from channels.layers import InMemoryChannelLayer, get_channel_layer
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+
+logger = logging.getLogger(__name__)
+
+# Seconds changes are collected before a batch is sent
+BROADCAST_TICK = 0.05
+
+# Sent in place of a subscriber's queued messages when it falls behind
+LAGGED_MESSAGE = {"type": "broadcast.lagged"}
+
+
+@dataclass
+class Topic:
+    """A named stream of change events."""
+
+    name: str
+    queryset: models.QuerySet | None = None
+    serializer_class: type | None = None
+    # Called with the connecting user; return False to refuse a subscription.
+    # Without it, only authenticated users can subscribe.
+    allow: Callable | None = None
+
+    @property
+    def group(self) -> str:
+        return f"topic.{self.name}"
+
+    def allows(self, user) -> bool:
+        """Return whether the user may subscribe to this topic."""
+        if self.allow is None:
+            return user is not None and user.is_authenticated
+        return bool(self.allow(user))
+
+    def build_events(self, changes: dict) -> list[dict]:
+        """Turn {pk: action} changes into events for this topic's subscribers."""
+        to_python = self.queryset.model._meta.pk.to_python
+        changes = {to_python(pk): action for pk, action in changes.items()}
+        events = []
+        saved = [pk for pk, action in changes.items() if action != "deleted"]
+        if saved:
+            rows = list(self.queryset.filter(pk__in=saved))
+            if self.serializer_class is not None:
+                data = self.serializer_class(rows, many=True).data
+            else:
+                data = [None] * len(rows)
+            matching = {row.pk: item for row, item in zip(rows, data, strict=True)}
+            for pk in saved:
+                if pk not in matching:
+                    # Saved but no longer in the queryset
+                    events.append({"action": "removed", "pk": pk})
+                elif matching[pk] is None:
+                    events.append({"action": changes[pk], "pk": pk})
+                else:
+                    events.append({"action": changes[pk], "pk": pk, "data": matching[pk]})
+        events.extend(
+            {"action": "deleted", "pk": pk}
+            for pk, action in changes.items()
+            if action == "deleted"
+        )
+        return events
+
+
+topics: dict[str, Topic] = {}
+
+
+def register_topic(name, queryset=None, serializer_class=None, allow=None) -> Topic:
+    """
+    Register a topic clients can subscribe to.
+
+    Only authenticated users can subscribe unless ``allow`` is given, e.g.
+    ``allow=lambda user: True`` for a public topic.
+    """
+    topic = Topic(name, queryset, serializer_class, allow)
+    topics[name] = topic
+    if queryset is not None:
+        for signal in (post_save, post_delete):
+            signal.connect(
+                _on_change, sender=queryset.model, dispatch_uid="broadcast"
+            )
+    return topic
+
+
+def _portable_pk(pk):
+    # Networked channel layers serialize messages; other pks go as strings
+    return pk if isinstance(pk, (int, str)) else str(pk)
+
+
+def _on_change(sender, instance, created=False, using=None, **kwargs):
+    if kwargs["signal"] is post_delete:
+        action = "deleted"
+    else:
+        action = "created" if created else "updated"
+    messages = [
+        (
+            topic.group,
+            {
+                "type": "broadcast.change",
+                "topic": topic.name,
+                "pk": _portable_pk(instance.pk),
+                "action": action,
+            },
+        )
+        for topic in topics.values()
+        if topic.queryset is not None and topic.queryset.model is sender
+    ]
+    if not messages or get_channel_layer() is None:
+        return
+
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        # Autocommit, so the change is already committed
+        _send(messages)
+        return
+    # Changes are sent together once the transaction commits, so subscribers
+    # read the saved rows. Django replaces run_on_commit on commit and on
+    # rollback, so a different list means the buffer's flush has run or was
+    # rolled back along with the changes in it.
+    hooks, pending = _pending_messages.get(connection, (None, None))
+    if hooks is not connection.run_on_commit:
+        pending = []
+        _pending_messages[connection] = (connection.run_on_commit, pending)
+        transaction.on_commit(partial(_send, pending), using=using)
+    pending.extend(messages)
+
+
+# Messages waiting for the current transaction, by database connection
+_pending_messages = weakref.WeakKeyDictionary()
+
+_send_tasks = set()
+
+
+def _send(messages: list[tuple[str, dict]]) -> None:
+    """Send messages to channel layer groups from sync or async code."""
+    channel_layer = get_channel_layer()
+    if channel_layer is None or not messages:
+        return
+
+    async def send():
+        for group, message in messages:
+            await channel_layer.group_send(group, message)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        async_to_sync(send)()
+        return
+    task = loop.create_task(send())
+    _send_tasks.add(task)
+    task.add_done_callback(_send_tasks.discard)
+
+
+class Broadcaster:
+    """
+    Batches the changes a process receives for its own subscribers.
+
+    Writers in any process send each committed change to the topic's group.
+    Every process with subscribers to the topic has one broadcaster channel
+    in that group, so it receives one copy, collects changes for one tick,
+    coalesces them per object and sends one serialized batch per topic to
+    its local subscribers.
+
+    The broadcaster starts on the event loop of the first subscription, so
+    processes without subscribers only send.
+    """
+
+    def __init__(self, tick: float = BROADCAST_TICK):
+        self.tick = tick
+        # Names this process's subscriber groups
+        self.id = uuid.uuid4().hex
+        self._changes = {}
+        self._events = {}
+        self._lagged = False
+        self._subscribers = Counter()
+        self._channel = None
+        self._ready = None
+        self._wake = None
+        self._tasks = []
+
+    def local_group(self, topic: Topic) -> str:
+        """Return the group of the topic's subscribers in this process."""
+        return f"{topic.group}.{self.id}"
+
+    async def start(self) -> None:
+        """Start receiving and flushing on the running event loop."""
+        if self._ready is None:
+            self._ready = asyncio.get_running_loop().create_future()
+            channel_layer = get_channel_layer()
+            self._channel = await channel_layer.new_channel("broadcaster.")
+            self._wake = asyncio.Event()
+            self._tasks = [
+                asyncio.create_task(self.receive(channel_layer)),
+                asyncio.create_task(self.flush(channel_layer)),
+            ]
+            self._ready.set_result(None)
+        await self._ready
+
+    async def stop(self) -> None:
+        """Stop receiving and flushing, dropping pending changes."""
+        channel_layer = get_channel_layer()
+        for name in self._subscribers:
+            await channel_layer.group_discard(topics[name].group, self._channel)
+        for task in self._tasks:
+            task.cancel()
+        self._channel = self._ready = self._wake = None
+        self._tasks = []
+        self._changes = {}
+        self._events = {}
+        self._lagged = False
+        self._subscribers = Counter()
+
+    async def subscribe(self, topic: Topic, channel_name: str) -> None:
+        """Add a consumer's channel to the topic's subscribers in this process."""
+        await self.start()
+        channel_layer = get_channel_layer()
+        await channel_layer.group_add(self.local_group(topic), channel_name)
+        self._subscribers[topic.name] += 1
+        if self._subscribers[topic.name] == 1:
+            await channel_layer.group_add(topic.group, self._channel)
+
+    async def unsubscribe(self, topic: Topic, channel_name: str) -> None:
+        """Remove a consumer's channel from the topic's subscribers."""
+        if not self._subscribers[topic.name]:
+            return
+        channel_layer = get_channel_layer()
+        await channel_layer.group_discard(self.local_group(topic), channel_name)
+        self._subscribers[topic.name] -= 1
+        if not self._subscribers[topic.name]:
+            del self._subscribers[topic.name]
+            await channel_layer.group_discard(topic.group, self._channel)
+
+    def publish(self, topic_name: str, event: dict) -> None:
+        """Send a custom event to a topic's subscribers in every process."""
+        message = {"type": "broadcast.event", "topic": topic_name, "event": event}
+        _send([(Topic(topic_name).group, message)])
+
+    async def receive(self, channel_layer) -> None:
+        while True:
+            message = await channel_layer.receive(self._channel)
+            if message["type"] == "broadcast.change":
+                changes = self._changes.setdefault(message["topic"], {})
+                pk, action = message["pk"], message["action"]
+                if changes.get(pk) == "created" and action == "updated":
+                    action = "created"
+                changes[pk] = action
+            elif message["type"] == "broadcast.event":
+                self._events.setdefault(message["topic"], []).append(message["event"])
+            elif message["type"] == "broadcast.lagged":
+                self._lagged = True
+            self._wake.set()
+
+    async def flush(self, channel_layer) -> None:
+        while True:
+            await self._wake.wait()
+            # Let the tick's changes accumulate
+            await asyncio.sleep(self.tick)
+            self._wake.clear()
+            changes, self._changes = self._changes, {}
+            events, self._events = self._events, {}
+            lagged, self._lagged = self._lagged, False
+
+            try:
+                if lagged:
+                    # This process missed changes, so its subscribers resync
+                    for name in list(self._subscribers):
+                        await channel_layer.group_send(
+                            self.local_group(topics[name]), LAGGED_MESSAGE
+                        )
+                messages = await database_sync_to_async(self.build_messages)(
+                    changes, events
+                )
+                for topic, text in messages:
+                    await channel_layer.group_send(
+                        self.local_group(topic),
+                        {"type": "broadcast.message", "text": text},
+                    )
+            except Exception:
+                logger.exception("Failed to broadcast changes.")
+
+    def build_messages(self, changes: dict, events: dict) -> list[tuple[Topic, str]]:
+        """Serialize one message per topic with pending events."""
+        messages = []
+        for name in changes.keys() | events.keys():
+            topic = topics.get(name)
+            if topic is None:
+                continue
+            topic_events = events.get(name, [])
+            if name in changes:
+                topic_events = topic_events + topic.build_events(changes[name])
+            if topic_events:
+                text = json.dumps(
+                    {"topic": name, "events": topic_events}, cls=DjangoJSONEncoder
+                )
+                messages.append((topic, text))
+        return messages
+
+
+broadcaster = Broadcaster()
+
+
+class BroadcastChannelLayer(InMemoryChannelLayer):
+    """
+    In-memory channel layer for high fan-out group sends.
+
+    Compared to InMemoryChannelLayer, group_send queues the same message for
+    every channel without copying it or creating a task per channel, and
+    expired messages are swept at most once per ``clean_interval`` instead of
+    on every send and receive. Messages must not be modified by consumers.
+
+    When a subscriber's queue is full, its queued messages are replaced with
+    a single "broadcast.lagged" message telling it to resync, so a slow
+    client can't hold memory or slow down the others.
+    """
+
+    def __init__(self, clean_interval: float = 1.0, **kwargs):
+        super().__init__(**kwargs)
+        self.clean_interval = clean_interval
+        self._last_clean = 0.0
+
+    def _clean_expired(self):
+        now = time.monotonic()
+        if now - self._last_clean < self.clean_interval:
+            return
+        self._last_clean = now
+        super()._clean_expired()
+
+    async def group_send(self, group, message):
+        assert isinstance(message, dict), "Message is not a dict"
+        self.require_valid_group_name(group)
+        self._clean_expired()
+
+        expires_at = time.time() + self.expiry
+        for channel in list(self.groups.get(group, ())):
+            queue = self.channels.get(channel)
+            if queue is None:
+                queue = self.channels[channel] = asyncio.Queue(
+                    maxsize=self.get_capacity(channel)
+                )
+            try:
+                queue.put_nowait((expires_at, message))
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait((expires_at, LAGGED_MESSAGE))
@@ -0,0 +1,60 @@
+"""
+Websocket consumers for $${name_snake}.
+"""
+
+from __future__ import annotations
+
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from .broadcast import broadcaster, topics
+
+
+class TopicConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Subscribe a websocket to broadcast topics.
+
+    Clients send {"action": "subscribe", "topic": "<name>"} or
+    {"action": "unsubscribe", "topic": "<name>"}, and receive
+    {"topic": "<name>", "events": [...]} batches. A {"lagged": true} message
+    means events were dropped because the client fell behind, so it should
+    reload its data.
+    """
+
+    async def connect(self):
+        self.subscriptions = set()
+        await self.accept()
+
+    async def disconnect(self, code):
+        for name in self.subscriptions:
+            await broadcaster.unsubscribe(topics[name], self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        action = content.get("action")
+        name = content.get("topic")
+        topic = topics.get(name)
+        if topic is None:
+            await self.send_json({"error": f"Unknown topic: {name}"})
+            return
+
+        if action == "subscribe":
+            if not topic.allows(self.scope.get("user")):
+                await self.send_json({"error": f"Not allowed to subscribe to {name}"})
+                return
+            if name not in self.subscriptions:
+                await broadcaster.subscribe(topic, self.channel_name)
+                self.subscriptions.add(name)
+            await self.send_json({"subscribed": name})
+        elif action == "unsubscribe":
+            if name in self.subscriptions:
+                await broadcaster.unsubscribe(topic, self.channel_name)
+                self.subscriptions.discard(name)
+            await self.send_json({"unsubscribed": name})
+        else:
+            await self.send_json({"error": f"Unknown action: {action}"})
+
+    async def broadcast_message(self, event):
+        # Already serialized once for all subscribers
+        await self.send(text_data=event["text"])
+
+    async def broadcast_lagged(self, event):
+        await self.send_json({"lagged": True})
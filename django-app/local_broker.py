@@ -0,0 +1,373 @@
+"""
+Local TaskIQ broker for $${name_snake}.
+
+Runs tasks on a single machine with no outside services. Messages and results
+are stored in a SQLite file, and ``manage.py run_task_workers`` starts the
+worker pool. For tests, use taskiq's InMemoryBroker, which runs tasks in the
+calling process.
+
+Select it in config/taskiq_config.py:
+
+    from taskiq import SmartRetryMiddleware
+
+    from $${parent_package_name}.$${name_snake}.local_broker import (
+        SQLiteBroker,
+        SQLiteResultBackend,
+    )
+
+    tasks_db = DATA_DIR / "tasks.sqlite3"
+    broker = (
+        SQLiteBroker(tasks_db)
+        .with_result_backend(SQLiteResultBackend(tasks_db))
+        .with_middlewares(
+            SmartRetryMiddleware(default_retry_count=3, use_delay_exponent=True)
+        )
+    )
+
+Limit how many runs of a task execute at once, across all worker processes:
+
+    @broker.task(max_concurrency=2)
+    async def summarize_document(document_pk: int) -> None:
+        ...
+
+Retries come from SmartRetryMiddleware. Its backoff is applied through the
+``delay`` label, which any message can also set to run later.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncGenerator, Iterable
+from dataclasses import asdict, is_dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+from taskiq import (
+    AckableMessage,
+    AsyncBroker,
+    AsyncResultBackend,
+    AsyncTaskiqTask,
+    BrokerMessage,
+    ResultGetError,
+    TaskiqMessage,
+    TaskiqMiddleware,
+    TaskiqResult,
+)
+from taskiq.depends.progress_tracker import TaskProgress
+from taskiq.labels import prepare_label
+from taskiq.utils import maybe_awaitable
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS taskiq_messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL,
+    task_name TEXT NOT NULL,
+    message BLOB NOT NULL,
+    max_concurrency INTEGER,
+    available_at REAL NOT NULL,
+    claimed_at REAL
+);
+CREATE INDEX IF NOT EXISTS taskiq_messages_available
+    ON taskiq_messages (available_at, id);
+CREATE INDEX IF NOT EXISTS taskiq_messages_task_name
+    ON taskiq_messages (task_name, claimed_at);
+CREATE TABLE IF NOT EXISTS taskiq_results (
+    task_id TEXT PRIMARY KEY,
+    result TEXT,
+    progress TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS taskiq_results_updated_at
+    ON taskiq_results (updated_at);
+"""
+
+# Claims the oldest available message whose task is under its concurrency
+# limit. Claims older than the claim timeout belong to a worker that died and
+# are handed out again.
+CLAIM_MESSAGE_SQL = """
+UPDATE taskiq_messages SET claimed_at = :now
+WHERE id = (
+    SELECT m.id FROM taskiq_messages AS m
+    WHERE m.available_at <= :now
+        AND (m.claimed_at IS NULL OR m.claimed_at < :stale)
+        AND (
+            m.max_concurrency IS NULL
+            OR m.max_concurrency > (
+                SELECT COUNT(*) FROM taskiq_messages AS r
+                WHERE r.task_name = m.task_name AND r.claimed_at >= :stale
+            )
+        )
+    ORDER BY m.available_at, m.id
+    LIMIT 1
+)
+RETURNING id, message
+"""
+
+
+class SQLiteStore:
+    """A SQLite connection shared by the event loop's worker threads."""
+
+    def __init__(self, path: str | Path):
+        self.path = str(path)
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA busy_timeout=5000")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def _call(self, func, *args):
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._connect()
+            return func(self._connection, *args)
+
+    async def run(self, func, *args):
+        """Run func(connection, *args) in a thread."""
+        return await asyncio.to_thread(self._call, func, *args)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _insert_messages(connection: sqlite3.Connection, rows: list[tuple]) -> None:
+    with connection:
+        connection.execute("BEGIN IMMEDIATE")
+        connection.executemany(
+            "INSERT INTO taskiq_messages "
+            "(task_id, task_name, message, max_concurrency, available_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+
+
+def _claim_message(connection: sqlite3.Connection, now: float, stale: float):
+    return connection.execute(
+        CLAIM_MESSAGE_SQL, {"now": now, "stale": stale}
+    ).fetchone()
+
+
+def _delete_message(connection: sqlite3.Connection, message_id: int) -> None:
+    connection.execute("DELETE FROM taskiq_messages WHERE id = ?", (message_id,))
+
+
+class SQLiteBroker(AsyncBroker):
+    """
+    TaskIQ broker that queues messages in a SQLite file.
+
+    Workers poll for messages every ``poll_interval`` seconds when the queue
+    is empty. A message stays claimed until its result is saved, so tasks
+    that run longer than ``claim_timeout`` seconds may be handed to a second
+    worker.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        poll_interval: float = 0.1,
+        claim_timeout: float = 3600,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.store = SQLiteStore(path)
+        self.poll_interval = poll_interval
+        self.claim_timeout = claim_timeout
+
+    async def shutdown(self) -> None:
+        await super().shutdown()
+        self.store.close()
+
+    async def kick(self, message: BrokerMessage) -> None:
+        await self.kick_many([message])
+
+    async def kick_many(self, messages: Iterable[BrokerMessage]) -> None:
+        """Queue several messages in one transaction."""
+        now = time.time()
+        rows = []
+        for message in messages:
+            max_concurrency = message.labels.get("max_concurrency")
+            delay = float(message.labels.get("delay") or 0)
+            rows.append(
+                (
+                    message.task_id,
+                    message.task_name,
+                    message.message,
+                    int(max_concurrency) if max_concurrency else None,
+                    now + delay,
+                )
+            )
+        await self.store.run(_insert_messages, rows)
+
+    async def listen(self) -> AsyncGenerator[AckableMessage, None]:
+        while True:
+            now = time.time()
+            row = await self.store.run(_claim_message, now, now - self.claim_timeout)
+            if row is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            message_id, data = row
+            yield AckableMessage(
+                data=data,
+                ack=partial(self.store.run, _delete_message, message_id),
+            )
+
+
+class SQLiteResultBackend(AsyncResultBackend):
+    """
+    TaskIQ result backend that stores results in a SQLite file.
+
+    Results are kept for ``result_ttl`` seconds. Return values must be JSON
+    serializable.
+    """
+
+    def __init__(self, path: str | Path, result_ttl: float = 24 * 60 * 60):
+        self.store = SQLiteStore(path)
+        self.result_ttl = result_ttl
+
+    async def shutdown(self) -> None:
+        await super().shutdown()
+        self.store.close()
+
+    async def set_result(self, task_id: str, result: TaskiqResult) -> None:
+        now = time.time()
+
+        def save(connection):
+            connection.execute(
+                "INSERT INTO taskiq_results (task_id, result, updated_at) "
+                "VALUES (?, ?, ?) ON CONFLICT (task_id) DO UPDATE "
+                "SET result = excluded.result, updated_at = excluded.updated_at",
+                (task_id, result.model_dump_json(), now),
+            )
+            connection.execute(
+                "DELETE FROM taskiq_results WHERE updated_at < ?",
+                (now - self.result_ttl,),
+            )
+
+        await self.store.run(save)
+
+    async def is_result_ready(self, task_id: str) -> bool:
+        return await self._get_column(task_id, "result") is not None
+
+    async def get_result(self, task_id: str, with_logs: bool = False) -> TaskiqResult:
+        data = await self._get_column(task_id, "result")
+        if data is None:
+            msg = f"No result for task {task_id}."
+            raise ResultGetError(msg)
+        result = TaskiqResult.model_validate_json(data)
+        if not with_logs:
+            result.log = None
+        return result
+
+    async def set_progress(self, task_id: str, progress: TaskProgress[Any]) -> None:
+        def save(connection):
+            connection.execute(
+                "INSERT INTO taskiq_results (task_id, progress, updated_at) "
+                "VALUES (?, ?, ?) ON CONFLICT (task_id) DO UPDATE "
+                "SET progress = excluded.progress, updated_at = excluded.updated_at",
+                (task_id, progress.model_dump_json(), time.time()),
+            )
+
+        await self.store.run(save)
+
+    async def get_progress(self, task_id: str) -> TaskProgress[Any] | None:
+        data = await self._get_column(task_id, "progress")
+        if data is None:
+            return None
+        return TaskProgress.model_validate_json(data)
+
+    async def _get_column(self, task_id: str, column: str):
+        def load(connection):
+            row = connection.execute(
+                f"SELECT {column} FROM taskiq_results WHERE task_id = ?",  # noqa: S608
+                (task_id,),
+            ).fetchone()
+            return None if row is None else row[0]
+
+        return await self.store.run(load)
+
+
+def _format_arg(arg: Any) -> Any:
+    # Pydantic models and dataclasses are sent as dicts, as kiq() does
+    if isinstance(arg, BaseModel):
+        return arg.model_dump(mode="json")
+    if is_dataclass(arg) and not isinstance(arg, type):
+        return asdict(arg)
+    return arg
+
+
+def build_message(kicker, args: tuple, kwargs: dict) -> TaskiqMessage:
+    """Build the message kiq() would send for one call."""
+    labels = {}
+    labels_types = {}
+    for label, value in kicker.labels.items():
+        # Exception classes for retries are read from the local task, never
+        # from the message, and can't be serialized
+        if label == "types_of_exceptions":
+            continue
+        labels[label], labels_types[label] = prepare_label(value)
+    return TaskiqMessage(
+        task_id=kicker.broker.id_generator(),
+        task_name=kicker.task_name,
+        labels=labels,
+        labels_types=labels_types,
+        args=[_format_arg(arg) for arg in args],
+        kwargs={name: _format_arg(value) for name, value in kwargs.items()},
+    )
+
+
+async def kiq_many(task, calls: Iterable[tuple | dict]) -> list[AsyncTaskiqTask]:
+    """
+    Send many calls of a task at once.
+
+    Each call is a tuple of positional arguments or a dict of keyword
+    arguments. With SQLiteBroker all messages are queued in one transaction;
+    other brokers get one kick per call.
+
+    Usage:
+        await kiq_many(process_document, [(pk,) for pk in document_pks])
+    """
+    kicker = task.kicker()
+    broker = kicker.broker
+    calls = [
+        ((), call) if isinstance(call, dict) else (tuple(call), {}) for call in calls
+    ]
+    if not isinstance(broker, SQLiteBroker):
+        return [await kicker.kiq(*args, **kwargs) for args, kwargs in calls]
+
+    messages = []
+    for args, kwargs in calls:
+        message = build_message(kicker, args, kwargs)
+        for middleware in broker.middlewares:
+            if middleware.__class__.pre_send != TaskiqMiddleware.pre_send:
+                message = await maybe_awaitable(middleware.pre_send(message))
+        messages.append(message)
+
+    await broker.kick_many(broker.formatter.dumps(message) for message in messages)
+
+    for message in messages:
+        for middleware in reversed(broker.middlewares):
+            if middleware.__class__.post_send != TaskiqMiddleware.post_send:
+                await maybe_awaitable(middleware.post_send(message))
+
+    return [
+        AsyncTaskiqTask(
+            task_id=message.task_id,
+            result_backend=broker.result_backend,
+            return_type=kicker.return_type,
+        )
+        for message in messages
+    ]
@@ -0,0 +1,97 @@
+"""
+Start a pool of TaskIQ worker processes.
+
+Discovers the task modules in every installed app's ``tasks`` package and runs
+them with the broker from config.taskiq_config, e.g. the local SQLiteBroker.
+"""
+
+from __future__ import annotations
+
+import os
+import pkgutil
+import subprocess
+import sys
+from importlib import import_module
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+BROKER = "config.taskiq_config:broker"
+
+
+def get_task_modules() -> list[str]:
+    """Return the task modules of every installed app."""
+    modules = []
+    for app_config in apps.get_app_configs():
+        name = f"{app_config.name}.tasks"
+        try:
+            package = import_module(name)
+        except ModuleNotFoundError as e:
+            # Only a missing tasks package is skipped, not failed imports in it
+            if e.name != name:
+                raise
+            continue
+        if not hasattr(package, "__path__"):
+            continue
+        modules.extend(
+            f"{package.__name__}.{module.name}"
+            for module in pkgutil.iter_modules(package.__path__)
+        )
+    return modules
+
+
+class Command(BaseCommand):
+    help = "Start a pool of TaskIQ worker processes for the installed apps' tasks."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes to start (default: CPU count).",
+        )
+        parser.add_argument(
+            "--max-async-tasks",
+            type=int,
+            default=10,
+            help="Tasks each worker runs concurrently (default: 10).",
+        )
+        parser.add_argument(
+            "--max-threadpool-threads",
+            type=int,
+            default=2,
+            help="Threads each worker uses for sync tasks (default: 2).",
+        )
+
+    def handle(self, *args, **options):
+        modules = get_task_modules()
+        if not modules:
+            self.stdout.write("No task modules found.")
+            return
+
+        self.stdout.write(f"Starting {options['workers']} workers for:")
+        for module in modules:
+            self.stdout.write(f"  {module}")
+
+        cmd = [
+            sys.executable,
+            "-m",
+            "taskiq",
+            "worker",
+            BROKER,
+            *modules,
+            "--workers",
+            str(options["workers"]),
+            "--max-async-tasks",
+            str(options["max_async_tasks"]),
+            "--max-threadpool-threads",
+            str(options["max_threadpool_threads"]),
+            # Messages stay claimed until their result is saved, which is
+            # what SQLiteBroker's concurrency limits and crash recovery use
+            "--ack-type",
+            "when_saved",
+        ]
+        try:
+            subprocess.run(cmd, check=True)
+        except KeyboardInterrupt:
+            self.stdout.write("Workers stopped.")
@@ -1 +1,11 @@
-websocket_urlpatterns = []
+from django.urls import path
+
+from .consumers import TopicConsumer
+
+# Register broadcast topics here, e.g.:
+# from .broadcast import register_topic
+# register_topic("items", Item.objects.all(), ItemSerializer)
+
+websocket_urlpatterns = [
+    path("ws/$${name_snake}/topics/", TopicConsumer.as_asgi()),
+]
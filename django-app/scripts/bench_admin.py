@@ -0,0 +1,242 @@
+"""
+Benchmark admin changelists on a large table.
+
+Creates a throwaway SQLite database with two tables, fills them with rows,
+and times the changelist for the first page, a deep page and a search with
+Django's stock ModelAdmin and with the admin from auto_register_models.
+
+Usage (from the project root):
+    PYTHONPATH=. python $${parent_package_name}/$${name_snake}/scripts/bench_admin.py --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+import types
+from pathlib import Path
+
+from django.apps import AppConfig
+
+# Label of the benchmark's own models, so they never touch a real app
+APP_LABEL = "bench"
+
+BATCH_SIZE = 10_000
+
+
+class BenchConfig(AppConfig):
+    """App for the benchmark's models, backed by this script."""
+
+    name = __name__
+    label = APP_LABEL
+
+
+def configure_django(data_dir: Path) -> None:
+    """Set up Django with a throwaway database and just the admin's apps."""
+    import django
+    from django.conf import settings
+
+    settings.configure(
+        SECRET_KEY="bench",
+        USE_TZ=True,
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": data_dir / "bench.sqlite3",
+            }
+        },
+        INSTALLED_APPS=[
+            "django.contrib.admin",
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "django.contrib.messages",
+            "django.contrib.sessions",
+            f"{__name__}.BenchConfig",
+        ],
+        TEMPLATES=[
+            {
+                "BACKEND": "django.template.backends.django.DjangoTemplates",
+                "APP_DIRS": True,
+                "OPTIONS": {
+                    "context_processors": [
+                        "django.template.context_processors.request",
+                        "django.contrib.auth.context_processors.auth",
+                        "django.contrib.messages.context_processors.messages",
+                    ]
+                },
+            }
+        ],
+        ROOT_URLCONF=__name__,
+    )
+    django.setup()
+
+
+urlpatterns = []
+
+
+def create_models() -> types.ModuleType:
+    """Define the benchmark models in a module of their own."""
+    from django.db import models
+
+    module = types.ModuleType(f"{APP_LABEL}.models")
+
+    class Meta:
+        app_label = APP_LABEL
+
+    module.BenchAuthor = type(
+        "BenchAuthor",
+        (models.Model,),
+        {
+            "__module__": module.__name__,
+            "Meta": Meta,
+            "name": models.CharField(max_length=100),
+            "__str__": lambda self: self.name,
+        },
+    )
+    module.BenchRow = type(
+        "BenchRow",
+        (models.Model,),
+        {
+            "__module__": module.__name__,
+            "Meta": Meta,
+            "title": models.CharField(max_length=100),
+            "author": models.ForeignKey(module.BenchAuthor, on_delete=models.CASCADE),
+            "score": models.IntegerField(),
+            "created_at": models.DateTimeField(),
+        },
+    )
+    return module
+
+
+class Superuser:
+    """Stand-in user with every permission, so no auth tables are needed."""
+
+    pk = id = 1
+    is_active = is_staff = is_superuser = is_authenticated = True
+
+    def has_perm(self, perm, obj=None):
+        return True
+
+    def has_perms(self, perms, obj=None):
+        return True
+
+    def has_module_perms(self, app_label):
+        return True
+
+    def get_username(self):
+        return "bench"
+
+    get_short_name = get_username
+
+
+class QueryTimer:
+    """Execute wrapper that counts queries and their total time."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+
+
+def seed(bench_models: types.ModuleType, rows: int) -> None:
+    from django.utils import timezone
+
+    print(f"Creating {rows} rows...")
+    authors = bench_models.BenchAuthor.objects.bulk_create(
+        bench_models.BenchAuthor(name=f"author {i}") for i in range(1000)
+    )
+    now = timezone.now()
+    for offset in range(0, rows, BATCH_SIZE):
+        bench_models.BenchRow.objects.bulk_create(
+            bench_models.BenchRow(
+                title=f"row {i}",
+                author=authors[i % len(authors)],
+                score=i % 97,
+                created_at=now,
+            )
+            for i in range(offset, min(offset + BATCH_SIZE, rows))
+        )
+
+
+def run(bench_models: types.ModuleType, rows: int, repeat: int) -> None:
+    from django.contrib import admin
+    from django.db import connection
+    from django.test import RequestFactory
+    from django.urls import clear_url_caches, path, reverse
+
+    from $${parent_package_name}.$${name_snake}.admin_utils import auto_register_models
+
+    class StockAdmin(admin.ModelAdmin):
+        list_display = ["id", "title", "author", "score", "created_at"]
+        search_fields = ["title"]
+
+    deep_page = rows // 100 // 2
+    cases = {
+        "first page": {},
+        f"page {deep_page}": {"p": deep_page},
+        "search": {"q": f"row {rows // 3}"},
+    }
+
+    print(f"{'admin':<8} {'case':<12} {'total ms':>9} {'sql ms':>8} {'queries':>8}")
+    for label in ("stock", "large"):
+        site = admin.AdminSite()
+        if label == "stock":
+            site.register(bench_models.BenchAuthor, StockAdmin)
+            site.register(bench_models.BenchRow, StockAdmin)
+        else:
+            auto_register_models(bench_models, admin_site=site)
+        model_admin = site._registry[bench_models.BenchRow]
+        # Route to this site, for reverse() in the changelist
+        urlpatterns[:] = [path("admin/", site.urls)]
+        clear_url_caches()
+        url = reverse(f"admin:{APP_LABEL}_benchrow_changelist")
+
+        for case, params in cases.items():
+            timings = []
+            sql_timings = []
+            for _ in range(repeat):
+                request = RequestFactory().get(url, params)
+                request.user = Superuser()
+                queries = QueryTimer()
+                with connection.execute_wrapper(queries):
+                    start = time.perf_counter()
+                    model_admin.changelist_view(request).render()
+                    timings.append(time.perf_counter() - start)
+                sql_timings.append(queries.seconds)
+            print(
+                f"{label:<8} {case:<12} {statistics.median(timings) * 1000:>9.1f} "
+                f"{statistics.median(sql_timings) * 1000:>8.1f} {queries.count:>8}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        configure_django(Path(data_dir))
+
+        from django.db import connection
+
+        bench_models = create_models()
+        with connection.schema_editor() as editor:
+            editor.create_model(bench_models.BenchAuthor)
+            editor.create_model(bench_models.BenchRow)
+        seed(bench_models, args.rows)
+        run(bench_models, args.rows, args.repeat)
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Benchmark websocket broadcast fan-out.
+
+Starts a local uvicorn server with TopicConsumer, connects many websocket
+clients to one topic, publishes events and reports how long it takes for
+every client to receive each batch. Runs on a throwaway SQLite database, so
+the app's own settings and data are left alone.
+
+Usage (from the project root):
+    PYTHONPATH=. python $${parent_package_name}/$${name_snake}/scripts/bench_broadcast.py --sockets 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+TOPIC = "bench"
+
+# Connections opened at once, to stay under the listen backlog
+CONNECT_BATCH = 500
+
+LAYERS = {
+    "broadcast": "$${parent_package_name}.$${name_snake}.broadcast.BroadcastChannelLayer",
+    "inmemory": "channels.layers.InMemoryChannelLayer",
+}
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    return statistics.quantiles(values, n=100)[int(fraction * 100) - 1]
+
+
+def ensure_file_limit(sockets: int) -> None:
+    """Raise the open file limit for both ends of every connection."""
+    needed = sockets * 2 + 100
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft >= needed:
+        return
+    if hard != resource.RLIM_INFINITY and hard < needed:
+        msg = f"{sockets} sockets need {needed} open files, but the limit is {hard}."
+        raise SystemExit(msg)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (needed, hard))
+
+
+def configure_django(data_dir: Path, layer: str) -> None:
+    """Set up Django with a throwaway database and the chosen channel layer."""
+    import django
+    from django.conf import settings
+
+    settings.configure(
+        SECRET_KEY="bench",
+        USE_TZ=True,
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": data_dir / "bench.sqlite3",
+            }
+        },
+        INSTALLED_APPS=[
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+        ],
+        CHANNEL_LAYERS={"default": {"BACKEND": LAYERS[layer]}},
+    )
+    django.setup()
+
+
+async def receive(client) -> float:
+    message = json.loads(await client.recv())
+    if "events" not in message:
+        msg = f"Unexpected message: {message}"
+        raise RuntimeError(msg)
+    return time.perf_counter()
+
+
+async def run(sockets: int, rounds: int, port: int) -> None:
+    import uvicorn
+    import websockets
+    from channels.routing import URLRouter
+    from django.urls import path
+
+    from $${parent_package_name}.$${name_snake}.broadcast import broadcaster
+    from $${parent_package_name}.$${name_snake}.consumers import TopicConsumer
+
+    app = URLRouter([path("ws/bench/", TopicConsumer.as_asgi())])
+    config = uvicorn.Config(
+        app, host="127.0.0.1", port=port, lifespan="off", log_level="warning"
+    )
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    url = f"ws://127.0.0.1:{port}/ws/bench/"
+    subscribe = json.dumps({"action": "subscribe", "topic": TOPIC})
+
+    async def connect():
+        client = await websockets.connect(url, max_queue=None)
+        await client.send(subscribe)
+        await client.recv()
+        return client
+
+    start = time.perf_counter()
+    clients = []
+    for offset in range(0, sockets, CONNECT_BATCH):
+        batch = min(CONNECT_BATCH, sockets - offset)
+        clients.extend(await asyncio.gather(*(connect() for _ in range(batch))))
+    connect_time = time.perf_counter() - start
+
+    latencies = []
+    last_arrivals = []
+    for _ in range(rounds):
+        sent_at = time.perf_counter()
+        broadcaster.publish(TOPIC, {"sent_at": sent_at})
+        arrivals = await asyncio.gather(*(receive(client) for client in clients))
+        latencies.extend(arrival - sent_at for arrival in arrivals)
+        last_arrivals.append(max(arrivals) - sent_at)
+
+    for offset in range(0, sockets, CONNECT_BATCH):
+        await asyncio.gather(
+            *(client.close() for client in clients[offset : offset + CONNECT_BATCH])
+        )
+    server.should_exit = True
+    await server_task
+    # The broadcaster's tasks belong to this event loop
+    await broadcaster.stop()
+
+    print(
+        f"{sockets:>8} {connect_time:>12.2f} {percentile(latencies, 0.5) * 1000:>9.1f} "
+        f"{percentile(latencies, 0.99) * 1000:>9.1f} "
+        f"{statistics.median(last_arrivals) * 1000:>10.1f} "
+        f"{sockets * rounds / sum(last_arrivals):>10.0f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sockets", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--layer",
+        choices=list(LAYERS),
+        default="broadcast",
+        help="Channel layer to benchmark (default: broadcast).",
+    )
+    args = parser.parse_args()
+
+    ensure_file_limit(max(args.sockets))
+    with tempfile.TemporaryDirectory() as data_dir:
+        configure_django(Path(data_dir), args.layer)
+
+        from $${parent_package_name}.$${name_snake}.broadcast import register_topic
+
+        # Benchmark clients connect without logging in
+        register_topic(TOPIC, allow=lambda user: True)
+
+        print(
+            f"{'sockets':>8} {'connect (s)':>12} {'p50 (ms)':>9} "
+            f"{'p99 (ms)':>9} {'last (ms)':>10} {'msgs/s':>10}"
+        )
+        for sockets in args.sockets:
+            asyncio.run(run(sockets, args.rounds, args.port))
+
+
+if __name__ == "__main__":
+    main()
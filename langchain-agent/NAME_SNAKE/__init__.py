@@ -2,7 +2,11 @@ from __future__ import annotations
 
 
 def get_graphs():
-    """Return graph definitions for LangGraph discovery."""
+    """Return graph definitions for LangGraph discovery.
+
+    Each path points to a lazy_graph factory, so loading one graph doesn't
+    build the others.
+    """
     return {
-        "example": "$${name_snake}.example_agent.agent:agent",
+        "example": "$${name_snake}.example_agent.agent:get_agent",
     }
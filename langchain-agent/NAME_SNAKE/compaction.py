@@ -0,0 +1,90 @@
+"""Bounded thread state: history compaction and checkpoint pruning."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from langchain.agents.middleware import AgentState, SummarizationMiddleware
+from langchain_core.language_models import BaseChatModel
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Tokens of history that trigger compaction
+MAX_HISTORY_TOKENS = 80_000
+
+# Tokens of recent history kept as is when compacting
+KEEP_HISTORY_TOKENS = 20_000
+
+
+class CompactionMiddleware(SummarizationMiddleware):
+    """Keep a thread's history and checkpoints from growing without limit.
+
+    Once the history reaches max_tokens, the messages before the most recent
+    keep_tokens are replaced with a summary. The cut never falls between a
+    tool call and its result, so the kept history is always valid.
+
+    After each run, the thread's superseded checkpoints are pruned from the
+    checkpointer, leaving only the latest. This gives up time travel to
+    earlier checkpoints of the thread. Checkpointers that don't implement
+    pruning, such as the in-memory one, are left as they are.
+    """
+
+    def __init__(
+        self,
+        model: BaseChatModel,
+        summary_model: BaseChatModel | None = None,
+        max_tokens: int = MAX_HISTORY_TOKENS,
+        keep_tokens: int = KEEP_HISTORY_TOKENS,
+        checkpointer: BaseCheckpointSaver | None = None,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            model: The agent's model, used to count tokens
+            summary_model: Model that writes the summaries, or None to use the
+                agent's model
+            max_tokens: Tokens of history that trigger compaction
+            keep_tokens: Tokens of recent history kept as is
+            checkpointer: The agent's checkpointer to prune, or None to keep
+                every checkpoint
+        """
+        super().__init__(
+            model,
+            trigger=("tokens", max_tokens),
+            keep=("tokens", keep_tokens),
+            summarizer=summary_model,
+        )
+        self.checkpointer = checkpointer
+
+    def after_agent(self, state: AgentState, runtime) -> dict[str, Any] | None:
+        thread_id = self._get_prunable_thread_id()
+        if thread_id is not None:
+            try:
+                self.checkpointer.prune([thread_id], strategy="keep_latest")
+            except NotImplementedError:
+                self._disable_pruning()
+        return None
+
+    async def aafter_agent(self, state: AgentState, runtime) -> dict[str, Any] | None:
+        thread_id = self._get_prunable_thread_id()
+        if thread_id is not None:
+            try:
+                await self.checkpointer.aprune([thread_id], strategy="keep_latest")
+            except NotImplementedError:
+                self._disable_pruning()
+        return None
+
+    def _get_prunable_thread_id(self) -> str | None:
+        if self.checkpointer is None:
+            return None
+        return get_config().get("configurable", {}).get("thread_id")
+
+    def _disable_pruning(self) -> None:
+        logger.info(
+            "%s does not support pruning; keeping every checkpoint.",
+            type(self.checkpointer).__name__,
+        )
+        self.checkpointer = None
@@ -7,16 +7,28 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from agent.checkpointers import get_checkpointer
 from agent.middleware import AgentInboxHumanInTheLoopMiddleware
 from agent.tools import think_tool
 from langchain.agents import create_agent
-from langchain.chat_models import init_chat_model
 
-from $${name_snake}.example_agent.prompts import SYSTEM_PROMPT
+from $${name_snake}.compaction import CompactionMiddleware
+from $${name_snake}.example_agent.prompts import CONTEXT_PROMPT, SYSTEM_PROMPT
 from $${name_snake}.example_agent.tools import interrupt_on, load_tools
+from $${name_snake}.graph_utils import (
+    get_chat_model,
+    get_shared_checkpointer,
+    lazy_graph,
+)
+from $${name_snake}.prompt_cache import CachedPromptMiddleware
+from $${name_snake}.tool_execution import ToolExecutionMiddleware
 
-checkpointer = get_checkpointer()
+# Tool calls allowed to run at once
+TOOL_CONCURRENCY = 8
+
+
+def get_context_prompt() -> str:
+    """Return the part of the system prompt that changes between calls."""
+    return CONTEXT_PROMPT.format(date=datetime.now().strftime("%Y-%m-%d"))
 
 
 def create_example_agent():
@@ -29,28 +41,40 @@ def create_example_agent():
     tools = load_tools()
     all_tools = tools + [think_tool]
 
-    # Get current date for prompt
-    current_date = datetime.now().strftime("%Y-%m-%d")
-
-    # Model
-    model = init_chat_model(
-        model="anthropic:claude-sonnet-4-5-20250929", temperature=0.0
-    )
+    # Model, shared with other graphs using the same settings
+    model = get_chat_model("anthropic:claude-sonnet-4-5-20250929", temperature=0.0)
+    checkpointer = get_shared_checkpointer()
 
-    # Create the agent with HITL middleware
+    # Create the agent with history compaction, prompt caching, HITL and
+    # tool execution middleware
     return create_agent(
         model,
         tools=all_tools,
-        system_prompt=SYSTEM_PROMPT.format(date=current_date),
         middleware=[
+            CompactionMiddleware(
+                model,
+                summary_model=get_chat_model("anthropic:claude-haiku-4-5-20251001"),
+                checkpointer=checkpointer,
+            ),
+            CachedPromptMiddleware(SYSTEM_PROMPT, get_context_prompt),
             AgentInboxHumanInTheLoopMiddleware(
                 interrupt_on=interrupt_on,
                 description_prefix="Tool execution pending approval",
             ),
+            ToolExecutionMiddleware(
+                max_concurrency=TOOL_CONCURRENCY, interrupt_on=interrupt_on
+            ),
         ],
         checkpointer=checkpointer,
     )
 
 
-# Create agent instance for LangGraph deployment
-agent = create_example_agent()
+# Agent factory for LangGraph deployment, built on first use
+get_agent = lazy_graph(create_example_agent)
+
+
+def __getattr__(name: str):
+    # Keeps `from ...agent import agent` working without building at import
+    if name == "agent":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
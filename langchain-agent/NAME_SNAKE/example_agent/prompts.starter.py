@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+# Instructions that are the same for every call, read from the prompt cache
 SYSTEM_PROMPT = """You are a helpful AI assistant.
 
-Today's date is {date}.
-
 Use the available tools to help the user with their requests.
 """
+
+# Context that changes between calls, sent after SYSTEM_PROMPT
+CONTEXT_PROMPT = """Today's date is {date}."""
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from langchain_core.tools import tool
 
+from $${name_snake}.tool_execution import memoized_tool
+
 
 def interrupt_on(tool_call: dict) -> bool:
     """Determine if a tool call should be interrupted for human approval.
@@ -19,6 +21,7 @@ def interrupt_on(tool_call: dict) -> bool:
     return tool_call.get("name") in interrupt_tools
 
 
+@memoized_tool
 @tool
 def example_tool(query: str) -> str:
     """An example tool that echoes back the query.
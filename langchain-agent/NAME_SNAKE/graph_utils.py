@@ -0,0 +1,80 @@
+"""Lazy graph construction and shared clients for agents."""
+
+from __future__ import annotations
+
+import functools
+import json
+import threading
+from collections.abc import Callable
+from typing import Any
+
+_models: dict[str, Any] = {}
+_models_lock = threading.Lock()
+
+
+def get_chat_model(model: str, **kwargs: Any):
+    """Return a chat model shared by every graph in the process.
+
+    Models created with the same arguments are the same instance, so graphs
+    share its API client and connection pool instead of opening their own.
+
+    Args:
+        model: The model name, e.g. "anthropic:claude-sonnet-4-5-20250929"
+        **kwargs: Other init_chat_model arguments, such as temperature
+
+    Returns:
+        The chat model
+    """
+    key = json.dumps({"model": model, **kwargs}, sort_keys=True, default=str)
+    with _models_lock:
+        if key not in _models:
+            # Imported here so listing graphs doesn't load LangChain
+            from langchain.chat_models import init_chat_model
+
+            _models[key] = init_chat_model(model=model, **kwargs)
+        return _models[key]
+
+
+@functools.cache
+def get_shared_checkpointer():
+    """Return the checkpointer shared by every graph in the process.
+
+    Returns:
+        The checkpointer from agent.checkpointers
+    """
+    from agent.checkpointers import get_checkpointer
+
+    return get_checkpointer()
+
+
+def lazy_graph(factory: Callable[[], Any]) -> Callable[..., Any]:
+    """Turn a graph factory into one that builds the graph on first use.
+
+    The returned function can be registered in get_graphs() in place of a
+    graph: it accepts LangGraph's optional config argument, builds the graph
+    the first time it is called and returns the same graph afterwards.
+
+    Usage:
+        @lazy_graph
+        def get_agent():
+            return create_agent(...)
+
+    Args:
+        factory: Function that builds the graph
+
+    Returns:
+        The caching graph factory
+    """
+    lock = threading.Lock()
+    graph = None
+
+    @functools.wraps(factory)
+    def get_graph(config: dict | None = None):
+        nonlocal graph
+        if graph is None:
+            with lock:
+                if graph is None:
+                    graph = factory()
+        return graph
+
+    return get_graph
@@ -0,0 +1,173 @@
+"""Prompt assembly that reuses the provider's prompt cache."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langchain.agents.middleware import (
+    AgentMiddleware,
+    AgentState,
+    ModelRequest,
+    ModelResponse,
+)
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.tools import BaseTool
+from typing_extensions import NotRequired
+
+logger = logging.getLogger(__name__)
+
+
+class PromptCacheState(AgentState):
+    """Agent state with the prompt cache usage of the latest run."""
+
+    prompt_cache_usage: NotRequired[dict[str, Any]]
+
+
+def get_cache_usage(messages: list) -> dict[str, Any]:
+    """Sum the token usage of the model calls made since the last user message.
+
+    Args:
+        messages: The thread's messages
+
+    Returns:
+        Model calls, input tokens, cache read and cache write tokens, and the
+        share of input tokens read from the cache
+    """
+    start = 0
+    for index, message in enumerate(messages):
+        if isinstance(message, HumanMessage):
+            start = index
+    usage = {"model_calls": 0, "input_tokens": 0, "cache_read": 0, "cache_write": 0}
+    for message in messages[start:]:
+        if not isinstance(message, AIMessage) or not message.usage_metadata:
+            continue
+        details = message.usage_metadata.get("input_token_details") or {}
+        usage["model_calls"] += 1
+        usage["input_tokens"] += message.usage_metadata.get("input_tokens", 0)
+        usage["cache_read"] += details.get("cache_read") or 0
+        usage["cache_write"] += details.get("cache_creation") or 0
+    usage["cached_ratio"] = (
+        round(usage["cache_read"] / usage["input_tokens"], 3)
+        if usage["input_tokens"]
+        else 0.0
+    )
+    return usage
+
+
+def _get_tool_name(tool: Any) -> str:
+    if isinstance(tool, dict):
+        return tool.get("name", "")
+    return getattr(tool, "name", "")
+
+
+def _is_anthropic_model(model: Any) -> bool:
+    try:
+        from langchain_anthropic import ChatAnthropic
+    except ImportError:
+        # Without the package, no model can be an Anthropic one
+        return False
+    return isinstance(model, ChatAnthropic)
+
+
+class CachedPromptMiddleware(AgentMiddleware):
+    """Build the system prompt so that unchanged content is read from the cache.
+
+    Anthropic caches a request's prefix in the order tools, system prompt,
+    messages. This middleware keeps that prefix identical between calls:
+
+    - Tools are sorted by name, with a cache breakpoint on the last one.
+    - The static prompt comes first in the system message, with a breakpoint
+      of its own, and the dynamic prompt (e.g. today's date) after it, so
+      changing it doesn't invalidate the tools and instructions.
+    - The conversation gets a breakpoint on its last message, so each turn
+      reads the previous turns from the cache.
+
+    After each run, the cache read and write tokens are logged and stored in
+    the state as prompt_cache_usage. Models from other providers get the same
+    system prompt as plain text, without breakpoints.
+    """
+
+    state_schema = PromptCacheState
+
+    def __init__(
+        self,
+        static_prompt: str,
+        dynamic_prompt: Callable[[], str] | None = None,
+        ttl: str = "5m",
+    ):
+        """Initialize the middleware.
+
+        Args:
+            static_prompt: Instructions that are the same for every call
+            dynamic_prompt: Function returning content that changes between
+                calls, added after the static prompt
+            ttl: How long the cache is kept, "5m" or "1h"
+        """
+        super().__init__()
+        self.static_prompt = static_prompt
+        self.dynamic_prompt = dynamic_prompt
+        self.cache_control = {"type": "ephemeral", "ttl": ttl}
+
+    def build_request(self, request: ModelRequest) -> ModelRequest:
+        """Return the request with the cache-friendly prompt and tools."""
+        dynamic = self.dynamic_prompt() if self.dynamic_prompt is not None else None
+        if not _is_anthropic_model(request.model):
+            text = self.static_prompt
+            if dynamic is not None:
+                text = f"{text}\n\n{dynamic}"
+            return request.override(system_message=SystemMessage(content=text))
+
+        blocks = [
+            {
+                "type": "text",
+                "text": self.static_prompt,
+                "cache_control": self.cache_control,
+            }
+        ]
+        if dynamic is not None:
+            blocks.append({"type": "text", "text": dynamic})
+
+        tools = sorted(request.tools, key=_get_tool_name)
+        if tools and isinstance(tools[-1], BaseTool):
+            last = tools[-1]
+            extras = {**(last.extras or {}), "cache_control": self.cache_control}
+            tools[-1] = last.model_copy(update={"extras": extras})
+
+        return request.override(
+            system_message=SystemMessage(content=blocks),
+            tools=tools,
+            # Breakpoint on the last message
+            model_settings={
+                **request.model_settings,
+                "cache_control": self.cache_control,
+            },
+        )
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelResponse:
+        return handler(self.build_request(request))
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        return await handler(self.build_request(request))
+
+    def after_agent(self, state: PromptCacheState, runtime) -> dict[str, Any]:
+        usage = get_cache_usage(state["messages"])
+        logger.info(
+            "Prompt cache: %d model calls, %d input tokens, %d read from cache, "
+            "%d written to cache (%.0f%% cached).",
+            usage["model_calls"],
+            usage["input_tokens"],
+            usage["cache_read"],
+            usage["cache_write"],
+            usage["cached_ratio"] * 100,
+        )
+        return {"prompt_cache_usage": usage}
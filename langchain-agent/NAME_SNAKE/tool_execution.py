@@ -0,0 +1,253 @@
+"""Concurrency limits and per-thread memoization for agent tools."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Annotated
+
+from langchain.agents.middleware import AgentMiddleware, AgentState, ToolCallRequest
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool
+from langgraph.types import Command
+from typing_extensions import NotRequired
+
+_MEMOIZE_KEY = "memoize"
+
+# Memoized results kept in each thread's state
+MEMO_MAXSIZE = 128
+
+
+def _merge_tool_results(
+    current: dict[str, ToolMessage] | None, update: dict[str, ToolMessage]
+) -> dict[str, ToolMessage]:
+    # Tool calls of one turn run in parallel, so their results are merged
+    merged = {**(current or {}), **update}
+    return dict(list(merged.items())[-MEMO_MAXSIZE:])
+
+
+class ToolExecutionState(AgentState):
+    """Agent state with the thread's memoized tool results."""
+
+    tool_results: NotRequired[Annotated[dict[str, ToolMessage], _merge_tool_results]]
+
+
+def memoized_tool(tool: BaseTool) -> BaseTool:
+    """Mark a tool's results as reusable within a thread.
+
+    ToolExecutionMiddleware returns the earlier result when the tool is
+    called again in the same thread with the same arguments. Only use it for
+    tools without side effects whose results don't go stale during a thread.
+
+    Usage:
+        @memoized_tool
+        @tool
+        def lookup(query: str) -> str:
+            ...
+
+    Args:
+        tool: The tool to mark
+
+    Returns:
+        The same tool
+    """
+    tool.metadata = {**(tool.metadata or {}), _MEMOIZE_KEY: True}
+    return tool
+
+
+class ToolExecutionMiddleware(AgentMiddleware):
+    """Limit concurrent tool calls and reuse memoized tool results.
+
+    The tool calls of one model turn already run in parallel; this caps how
+    many of them run at once across the graph, so a turn with many calls
+    doesn't exhaust rate limits or connections.
+
+    Results of @memoized_tool tools are stored in the agent state as
+    tool_results, keyed by the tool name and its normalized arguments, so
+    they are checkpointed with the thread they belong to. An identical call
+    made while one is still running waits for its result. Calls that
+    interrupt_on gates for human approval always run, so an approved call is
+    never answered from memory.
+    """
+
+    state_schema = ToolExecutionState
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        interrupt_on: Callable[[dict], bool] | None = None,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            max_concurrency: Tool calls allowed to run at once, or None for
+                no limit
+            interrupt_on: The agent's human-in-the-loop predicate
+        """
+        super().__init__()
+        self.max_concurrency = max_concurrency
+        self.interrupt_on = interrupt_on
+        self._lock = threading.Lock()
+        # Calls running now, by thread ID and memo key
+        self._pending: dict[tuple[str, str], Future] = {}
+        self._thread_semaphore = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        )
+        # asyncio semaphores belong to one event loop
+        self._loop_semaphores = weakref.WeakKeyDictionary()
+
+    def wrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], ToolMessage | Command],
+    ) -> ToolMessage | Command:
+        key = self._get_memo_key(request)
+        if key is None:
+            return self._call(request, handler)
+        message = self._get_result(key, request)
+        if message is not None:
+            return self._reuse(message, request)
+
+        future, running = self._claim(key, request)
+        if running:
+            message = future.result()
+            if message is not None:
+                return self._reuse(message, request)
+            return self._call(request, handler)
+
+        message = None
+        try:
+            result = self._call(request, handler)
+            message = self._get_reusable(result)
+        finally:
+            self._release(key, request, future, message)
+        return self._remember(key, result, message)
+
+    async def awrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command]],
+    ) -> ToolMessage | Command:
+        key = self._get_memo_key(request)
+        if key is None:
+            return await self._acall(request, handler)
+        message = self._get_result(key, request)
+        if message is not None:
+            return self._reuse(message, request)
+
+        future, running = self._claim(key, request)
+        if running:
+            # Shielded, so a cancelled waiter doesn't cancel the shared future
+            message = await asyncio.shield(asyncio.wrap_future(future))
+            if message is not None:
+                return self._reuse(message, request)
+            return await self._acall(request, handler)
+
+        message = None
+        try:
+            result = await self._acall(request, handler)
+            message = self._get_reusable(result)
+        finally:
+            self._release(key, request, future, message)
+        return self._remember(key, result, message)
+
+    def _call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], ToolMessage | Command],
+    ) -> ToolMessage | Command:
+        if self._thread_semaphore is None:
+            return handler(request)
+        with self._thread_semaphore:
+            return handler(request)
+
+    async def _acall(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command]],
+    ) -> ToolMessage | Command:
+        semaphore = self._get_loop_semaphore()
+        if semaphore is None:
+            return await handler(request)
+        async with semaphore:
+            return await handler(request)
+
+    def _get_loop_semaphore(self) -> asyncio.Semaphore | None:
+        if not self.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._loop_semaphores:
+                self._loop_semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+            return self._loop_semaphores[loop]
+
+    def _get_memo_key(self, request: ToolCallRequest) -> str | None:
+        tool = request.tool
+        if tool is None or not (tool.metadata or {}).get(_MEMOIZE_KEY):
+            return None
+        if self.interrupt_on is not None and self.interrupt_on(request.tool_call):
+            return None
+        return json.dumps(
+            [tool.name, request.tool_call["args"]], sort_keys=True, default=str
+        )
+
+    def _get_result(self, key: str, request: ToolCallRequest) -> ToolMessage | None:
+        state = request.state if isinstance(request.state, dict) else {}
+        return (state.get("tool_results") or {}).get(key)
+
+    def _claim(self, key: str, request: ToolCallRequest) -> tuple[Future, bool]:
+        """Return the future for the call, and whether it was already running."""
+        thread_id = _get_thread_id(request)
+        if thread_id is None:
+            # Without a thread, calls of separate runs can't be told apart
+            return Future(), False
+        pending_key = (thread_id, key)
+        with self._lock:
+            future = self._pending.get(pending_key)
+            if future is not None:
+                return future, True
+            future = self._pending[pending_key] = Future()
+            return future, False
+
+    def _release(
+        self,
+        key: str,
+        request: ToolCallRequest,
+        future: Future,
+        message: ToolMessage | None,
+    ) -> None:
+        # Waiters run the call themselves when there's no result to reuse
+        with self._lock:
+            self._pending.pop((_get_thread_id(request), key), None)
+        future.set_result(message)
+
+    @staticmethod
+    def _get_reusable(result: ToolMessage | Command) -> ToolMessage | None:
+        # Commands update state, and errors may be transient, so neither is reused
+        if not isinstance(result, ToolMessage) or result.status == "error":
+            return None
+        return result
+
+    @staticmethod
+    def _reuse(message: ToolMessage, request: ToolCallRequest) -> ToolMessage:
+        # Answer this call with the earlier call's content
+        return message.model_copy(
+            update={"tool_call_id": request.tool_call["id"], "id": None}
+        )
+
+    @staticmethod
+    def _remember(
+        key: str, result: ToolMessage | Command, message: ToolMessage | None
+    ) -> ToolMessage | Command:
+        if message is None:
+            return result
+        return Command(update={"messages": [result], "tool_results": {key: message}})
+
+
+def _get_thread_id(request: ToolCallRequest) -> str | None:
+    config = request.runtime.config if request.runtime is not None else {}
+    return config.get("configurable", {}).get("thread_id")
@@ -0,0 +1,138 @@
+"""Measure startup of a process hosting many graphs.
+
+Each run starts a fresh Python process that imports this package and
+registers N copies of the example agent, then reports how long it took to be
+ready and how long the first graph took to build. Eager runs build every graph
+at startup with its own chat model, as modules creating their agent at import
+time with init_chat_model do. Lazy-all runs then build all N graphs, to show
+they share one chat model. The host run loads the graphs registered in
+get_graphs() through the package's entry point, as the host process does.
+
+    python bench_graph_startup.py --graphs 1 5 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+CHILD = """
+import json, sys, time
+
+start = time.perf_counter()
+from $${name_snake} import graph_utils
+from $${name_snake}.example_agent import agent
+
+count, mode = int(sys.argv[1]), sys.argv[2]
+graphs = [graph_utils.lazy_graph(agent.create_example_agent) for _ in range(count)]
+models = set()
+if mode == "eager":
+    for get_graph in graphs:
+        graph_utils._models.clear()
+        get_graph()
+        models.update(map(id, graph_utils._models.values()))
+ready = time.perf_counter() - start
+
+start = time.perf_counter()
+graphs[0]()
+first_use = time.perf_counter() - start
+
+start = time.perf_counter()
+if mode == "lazy-all":
+    for get_graph in graphs:
+        get_graph()
+all_built = time.perf_counter() - start if mode == "lazy-all" else None
+models.update(map(id, graph_utils._models.values()))
+print(json.dumps({
+    "graphs": count,
+    "ready": ready,
+    "first_use": first_use,
+    "all_built": all_built,
+    "models": len(models),
+}))
+"""
+
+# Loads graphs the way the host process does: from the package's
+# "agent.graphs" entry point, or get_graphs() when the package isn't installed
+HOST_CHILD = """
+import importlib, json, time
+from importlib.metadata import entry_points
+
+start = time.perf_counter()
+entry_point = next(iter(entry_points(group="agent.graphs", name="$${name_snake}")), None)
+if entry_point is not None:
+    get_graphs = entry_point.load()
+else:
+    from $${name_snake} import get_graphs
+graphs = []
+for path in get_graphs().values():
+    module_name, _, attr = path.partition(":")
+    graphs.append(getattr(importlib.import_module(module_name), attr))
+ready = time.perf_counter() - start
+
+from $${name_snake} import graph_utils
+
+start = time.perf_counter()
+graphs[0]()
+first_use = time.perf_counter() - start
+
+start = time.perf_counter()
+for get_graph in graphs:
+    get_graph()
+all_built = time.perf_counter() - start
+print(json.dumps({
+    "graphs": len(graphs),
+    "ready": ready,
+    "first_use": first_use,
+    "all_built": all_built,
+    "models": len(graph_utils._models),
+}))
+"""
+
+
+def run(count: int, mode: str) -> dict:
+    # The model client is created without making requests
+    env = {"ANTHROPIC_API_KEY": "unused", **os.environ}
+    if mode == "host":
+        command = [sys.executable, "-c", HOST_CHILD]
+    else:
+        command = [sys.executable, "-c", CHILD, str(count), mode]
+    output = subprocess.run(
+        command,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def print_result(mode: str, result: dict) -> None:
+    all_built = result["all_built"]
+    all_built = "-" if all_built is None else f"{all_built * 1000:.1f}"
+    print(
+        f"{result['graphs']:>6} {mode:<8} {result['ready'] * 1000:>11.1f} "
+        f"{result['first_use'] * 1000:>15.1f} {all_built:>14} {result['models']:>7}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--graphs", type=int, nargs="+", default=[1, 5, 20])
+    args = parser.parse_args()
+
+    print(
+        f"{'graphs':>6} {'mode':<8} {'ready (ms)':>11} {'first use (ms)':>15} "
+        f"{'all built (ms)':>14} {'models':>7}"
+    )
+    for count in args.graphs:
+        for mode in ("eager", "lazy", "lazy-all"):
+            print_result(mode, run(count, mode))
+    print_result("host", run(0, "host"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""Result caching for $${name_pretty} MCP tools."""
+
+import asyncio
+import functools
+import inspect
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import orjson
+from mcp.server.fastmcp import Context
+
+logger = logging.getLogger(__name__)
+
+# Log each cache's stats after this many lookups
+STATS_LOG_INTERVAL = 100
+
+# Results kept in a disk store before the oldest are deleted
+DISK_MAXSIZE = 10_000
+
+# Delete expired and excess disk rows after this many writes
+DISK_PRUNE_INTERVAL = 100
+
+# Seconds a disk store query waits for another process's write to finish
+DISK_BUSY_TIMEOUT = 10
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters for one tool's cache."""
+
+    hits: int = 0
+    misses: int = 0
+    # Calls that waited for an identical call already running
+    shared: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.shared
+        return (self.hits + self.shared) / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 3)}
+
+
+class DiskStore:
+    """SQLite file holding cached results as JSON, so they survive restarts.
+
+    Several server processes can share the file. Store errors, such as a
+    write that keeps finding the database locked, are logged and treated as
+    misses, so they never fail a tool call. Expired rows and rows past
+    maxsize, oldest first, are deleted every DISK_PRUNE_INTERVAL writes.
+    """
+
+    def __init__(self, path: Path, maxsize: int = DISK_MAXSIZE):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._connection = sqlite3.connect(
+            path, timeout=DISK_BUSY_TIMEOUT, check_same_thread=False
+        )
+        # WAL lets processes read while another writes
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache"
+            " (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)"
+        )
+
+    async def get(self, key: str) -> tuple[Any, float | None] | Any:
+        """Return the stored (value, expires_at), or _MISSING."""
+        # sqlite3 blocks, so queries run in a thread to keep the loop free
+        try:
+            return await asyncio.to_thread(self._get, key)
+        except sqlite3.Error:
+            logger.warning("Could not read the disk cache.", exc_info=True)
+            return _MISSING
+
+    async def set(self, key: str, value: Any, expires_at: float | None) -> None:
+        try:
+            data = orjson.dumps(value)
+        except TypeError:
+            # Only JSON results are stored on disk
+            return
+        try:
+            await asyncio.to_thread(self._set, key, data, expires_at)
+        except sqlite3.Error:
+            logger.warning("Could not write to the disk cache.", exc_info=True)
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache")
+
+    def _get(self, key: str) -> tuple[Any, float | None] | Any:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return _MISSING
+        return orjson.loads(row[0]), row[1]
+
+    def _set(self, key: str, data: bytes, expires_at: float | None) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                (key, data, expires_at),
+            )
+            self._writes += 1
+            if self._writes % DISK_PRUNE_INTERVAL == 0:
+                self._prune()
+
+    def _prune(self) -> None:
+        self._connection.execute(
+            "DELETE FROM cache WHERE expires_at <= ?", (time.time(),)
+        )
+        # Replacing a row gives it a new rowid, so the lowest are the oldest
+        self._connection.execute(
+            "DELETE FROM cache WHERE rowid <= ("
+            " SELECT rowid FROM cache ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+            (self.maxsize,),
+        )
+
+
+class ToolCache:
+    """LRU cache of tool results, keyed on the normalized call arguments.
+
+    Identical calls made while one is still running wait for its result
+    instead of running again. Errors are not cached. Keys include the tool
+    name and version, so tools can share a disk store, and bumping the
+    version stops results stored by an older version from being served.
+
+    Usage:
+        @mcp_tool(cache=True)
+        async def lookup(symbol: str) -> dict[str, Any]: ...
+
+        @mcp_tool(cache=ToolCache(ttl=60, path=Path("data/quotes.sqlite3"), version=2))
+        async def get_quote(symbol: str) -> dict[str, Any]: ...
+
+    Args:
+        maxsize: Results kept in memory before the least recently used is dropped.
+        ttl: Seconds a result stays valid, or None to keep it until evicted.
+        path: SQLite file that also stores results, or None for memory only.
+        version: Bump when the tool's results change shape or meaning.
+        disk_maxsize: Results kept in the SQLite file. Tools sharing a file
+            share this limit too.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float | None = 300,
+        path: Path | None = None,
+        version: int | str = 1,
+        disk_maxsize: int = DISK_MAXSIZE,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.store = DiskStore(path, disk_maxsize) if path is not None else None
+        self.version = version
+        self.name = None
+        self.stats = CacheStats()
+        self._entries = OrderedDict()
+        self._pending = {}
+
+    async def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at is None or expires_at > time.time():
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+        if self.store is not None:
+            entry = await self.store.get(key)
+            if entry is _MISSING:
+                return _MISSING
+            # Keep the stored expiry, so a disk hit doesn't extend the TTL
+            value, expires_at = entry
+            self._remember(key, value, expires_at)
+            return value
+        return _MISSING
+
+    async def set(self, key: str, value: Any) -> None:
+        expires_at = self._get_expiry()
+        self._remember(key, value, expires_at)
+        if self.store is not None:
+            await self.store.set(key, value, expires_at)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    async def call(self, func: Callable, kwargs: dict[str, Any]) -> Any:
+        """Return a cached result, or call func and cache what it returns."""
+        key = make_cache_key(self.name, self.version, kwargs)
+        value = await self.get(key)
+        if value is not _MISSING:
+            self.stats.hits += 1
+            self._log_stats()
+            return value
+
+        task = self._pending.get(key)
+        if task is not None:
+            self.stats.shared += 1
+        else:
+            self.stats.misses += 1
+            task = asyncio.ensure_future(self._run(func, kwargs, key))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        self._log_stats()
+        # One caller being cancelled doesn't cancel the call the others wait on
+        return await asyncio.shield(task)
+
+    async def _run(self, func: Callable, kwargs: dict[str, Any], key: str) -> Any:
+        result = func(**kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        await self.set(key, result)
+        return result
+
+    def _get_expiry(self) -> float | None:
+        return time.time() + self.ttl if self.ttl is not None else None
+
+    def _remember(self, key: str, value: Any, expires_at: float | None) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _log_stats(self) -> None:
+        stats = self.stats
+        if (stats.hits + stats.misses + stats.shared) % STATS_LOG_INTERVAL == 0:
+            logger.info("Cache stats for %s: %s", self.name, stats.to_dict())
+
+
+caches: dict[str, ToolCache] = {}
+
+
+def make_cache_key(tool: str, version: int | str, kwargs: dict[str, Any]) -> str:
+    """Return a key that is the same for equal arguments in any order."""
+    arguments = {
+        name: value for name, value in kwargs.items() if not isinstance(value, Context)
+    }
+    return orjson.dumps(
+        [tool, version, arguments],
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+def cache_results(
+    func: Callable, cache: ToolCache, name: str | None = None
+) -> Callable:
+    """Wrap a tool function so its results are served from a cache.
+
+    Args:
+        func: The tool function.
+        cache: The cache to serve results from.
+        name: The tool's name. Defaults to the function's name.
+    """
+    cache.name = name or func.__name__
+    caches[cache.name] = cache
+
+    @functools.wraps(func)
+    async def wrapper(**kwargs):
+        return await cache.call(func, kwargs)
+
+    return wrapper
+
+
+def get_cache_stats() -> dict[str, dict[str, Any]]:
+    """Return the stats of every tool cache, by tool name.
+
+    Usage, to expose them to clients:
+        @mcp_tool()
+        async def cache_stats() -> dict[str, Any]:
+            '''Report tool cache hit rates.'''
+            return get_cache_stats()
+    """
+    return {name: cache.stats.to_dict() for name, cache in caches.items()}
@@ -0,0 +1,171 @@
+"""Shared HTTP client for $${name_pretty} MCP tools."""
+
+import asyncio
+import logging
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+from mcp.server.fastmcp import Context
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT = float(os.environ.get("HTTP_TIMEOUT", "30"))
+HTTP_CONNECT_TIMEOUT = float(os.environ.get("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_MAX_CONNECTIONS = int(os.environ.get("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.environ.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+)
+HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP2 = os.environ.get("HTTP2", "false").lower() == "true"
+HTTP_RETRIES = int(os.environ.get("HTTP_RETRIES", "2"))
+
+# Responses worth retrying for idempotent requests
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+RETRY_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Seconds before the first retry, doubled for each one after
+RETRY_BACKOFF = 0.5
+
+# Longest Retry-After to wait for; responses asking for more are returned as is
+HTTP_RETRY_MAX_DELAY = float(os.environ.get("HTTP_RETRY_MAX_DELAY", "10"))
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Transport that retries idempotent requests on transient failures.
+
+    Connection errors, timeouts and RETRY_STATUS_CODES responses are retried
+    with exponential backoff, honoring Retry-After when the server sends it.
+    A Retry-After longer than max_delay isn't waited for: the response is
+    returned so the tool call fails fast instead of hanging.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retries: int = HTTP_RETRIES,
+        backoff: float = RETRY_BACKOFF,
+        max_delay: float = HTTP_RETRY_MAX_DELAY,
+    ):
+        self.transport = transport
+        self.retries = retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in RETRY_METHODS:
+            return await self.transport.handle_async_request(request)
+
+        attempt = 0
+        while True:
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError:
+                if attempt == self.retries:
+                    raise
+                delay = self.backoff * 2**attempt
+            else:
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt == self.retries
+                ):
+                    return response
+                delay = self._get_retry_after(response, self.backoff * 2**attempt)
+                if delay > self.max_delay:
+                    logger.info(
+                        "Not retrying %s %s: Retry-After of %.1fs exceeds %.1fs.",
+                        request.method,
+                        request.url,
+                        delay,
+                        self.max_delay,
+                    )
+                    return response
+                await response.aclose()
+
+            attempt += 1
+            logger.info(
+                "Retrying %s %s in %.1fs (attempt %d of %d).",
+                request.method,
+                request.url,
+                delay,
+                attempt,
+                self.retries,
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    @staticmethod
+    def _get_retry_after(response: httpx.Response, default: float) -> float:
+        try:
+            return max(float(response.headers["Retry-After"]), 0.0)
+        except (KeyError, ValueError):
+            return default
+
+
+def create_http_client(**kwargs) -> httpx.AsyncClient:
+    """Create an HTTP client with connection pooling, timeouts and retries.
+
+    Args:
+        **kwargs: Extra httpx.AsyncClient arguments, such as base_url or headers.
+
+    Returns:
+        A client that should be shared by every tool call and closed on shutdown.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=HTTP2,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        # Only retries failed connection attempts
+        retries=1,
+    )
+    return httpx.AsyncClient(
+        transport=RetryTransport(transport),
+        timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        follow_redirects=True,
+        **kwargs,
+    )
+
+
+_client: httpx.AsyncClient | None = None
+_client_users = 0
+
+
+@asynccontextmanager
+async def shared_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the process-wide HTTP client, closing it after its last user.
+
+    FastMCP runs the lifespan once per session over HTTP transports, so
+    sessions share one connection pool instead of opening their own.
+    """
+    global _client, _client_users
+    if _client is None:
+        _client = create_http_client()
+    _client_users += 1
+    client = _client
+    try:
+        yield client
+    finally:
+        _client_users -= 1
+        if _client_users == 0:
+            _client = None
+            await client.aclose()
+
+
+def get_http_client(ctx: Context) -> httpx.AsyncClient:
+    """Return the shared HTTP client from a tool's context.
+
+    Usage:
+        @mcp_tool()
+        async def get_status(url: str, ctx: Context) -> dict[str, Any]:
+            '''Fetch a status page.'''
+            response = await get_http_client(ctx).get(url)
+            response.raise_for_status()
+            return response.json()
+    """
+    return ctx.request_context.lifespan_context.http
@@ -0,0 +1,382 @@
+"""Multi-worker streamable HTTP serving for the $${name_pretty} MCP server.
+
+With MCP_WORKERS > 1, requests are spread over several worker processes
+behind one port:
+
+- Stateless (MCP_STATELESS=true, the default with several workers): uvicorn
+  runs the workers on a shared socket, since any worker can answer any
+  request. Send SIGHUP to the server to replace the workers one at a time.
+- Stateful: each worker listens on its own Unix socket, and the parent
+  process proxies requests to the worker that created their session, read
+  from the mcp-session-id header. SIGHUP replaces the workers one at a time;
+  sessions on a replaced worker end and clients start new ones. Workers that
+  exit are replaced, and sessions idle for MCP_SESSION_IDLE_TIMEOUT end.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import multiprocessing
+import os
+import signal
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+import uvicorn
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+MCP_HOST = os.environ.get("MCP_HOST", "127.0.0.1")
+MCP_PORT = int(os.environ.get("MCP_PORT", "8000"))
+MCP_WORKERS = int(os.environ.get("MCP_WORKERS", "1"))
+MCP_STATELESS = (
+    os.environ.get("MCP_STATELESS", "true" if MCP_WORKERS > 1 else "false").lower()
+    == "true"
+)
+# Seconds a stopping worker waits for in-flight requests to finish
+MCP_GRACEFUL_TIMEOUT = float(os.environ.get("MCP_GRACEFUL_TIMEOUT", "30"))
+# Seconds a stateful session can go without requests before it ends
+MCP_SESSION_IDLE_TIMEOUT = float(os.environ.get("MCP_SESSION_IDLE_TIMEOUT", "3600"))
+
+APP_FACTORY = "$${name_snake}.mcp:create_http_app"
+SESSION_ID_HEADER = "mcp-session-id"
+
+# Seconds a new worker has to start accepting connections
+WORKER_START_TIMEOUT = 30
+
+# Seconds between checks for exited workers and idle sessions
+SUPERVISE_INTERVAL = 1
+
+_HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "upgrade"}
+
+
+def run_http_server() -> None:
+    """Serve the MCP server over streamable HTTP with MCP_WORKERS processes."""
+    if MCP_WORKERS == 1 or MCP_STATELESS:
+        uvicorn.run(
+            APP_FACTORY,
+            factory=True,
+            host=MCP_HOST,
+            port=MCP_PORT,
+            workers=MCP_WORKERS,
+            timeout_graceful_shutdown=MCP_GRACEFUL_TIMEOUT,
+        )
+        return
+
+    with tempfile.TemporaryDirectory(prefix="$${name_snake}-") as directory:
+        proxy = SessionAffinityProxy(Path(directory), MCP_WORKERS)
+        uvicorn.run(
+            proxy,
+            host=MCP_HOST,
+            port=MCP_PORT,
+            lifespan="on",
+            timeout_graceful_shutdown=MCP_GRACEFUL_TIMEOUT,
+        )
+
+
+def _serve_worker(socket_path: str) -> None:
+    uvicorn.run(
+        APP_FACTORY,
+        factory=True,
+        uds=socket_path,
+        timeout_graceful_shutdown=MCP_GRACEFUL_TIMEOUT,
+    )
+
+
+class Worker:
+    """A worker process serving the MCP app on a Unix socket."""
+
+    _generations = itertools.count()
+
+    def __init__(self, directory: Path, index: int):
+        self.socket_path = str(
+            directory / f"worker-{index}-{next(self._generations)}.sock"
+        )
+        self.process = multiprocessing.get_context("spawn").Process(
+            target=_serve_worker, args=(self.socket_path,), daemon=True
+        )
+        self.client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=self.socket_path),
+            base_url="http://worker",
+            # Server-sent event streams stay open between messages
+            timeout=httpx.Timeout(None, connect=5),
+        )
+
+    async def start(self) -> None:
+        self.process.start()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + WORKER_START_TIMEOUT
+        while loop.time() < deadline:
+            if not self.process.is_alive():
+                break
+            with contextlib.suppress(OSError):
+                _, writer = await asyncio.open_unix_connection(self.socket_path)
+                writer.close()
+                return
+            await asyncio.sleep(0.1)
+        await self.stop()
+        msg = f"Worker on {self.socket_path} did not start."
+        raise RuntimeError(msg)
+
+    async def stop(self) -> None:
+        # uvicorn finishes in-flight requests on SIGTERM
+        if self.process.is_alive():
+            self.process.terminate()
+        await asyncio.to_thread(self.process.join, MCP_GRACEFUL_TIMEOUT + 5)
+        if self.process.is_alive():
+            self.process.kill()
+        await self.client.aclose()
+
+
+@dataclass
+class Session:
+    """A stateful MCP session and the worker holding it."""
+
+    worker: Worker
+    path: str
+    # Workers check the Host header, so requests of their own reuse the client's
+    host: str
+    last_seen: float
+    # Responses still streaming, such as an open server-sent event stream
+    streams: int = 0
+
+
+def _session_not_found() -> JSONResponse:
+    # Clients start a new session when theirs is not found
+    return JSONResponse(
+        {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {"code": -32600, "message": "Session not found"},
+        },
+        status_code=404,
+    )
+
+
+class SessionAffinityProxy:
+    """ASGI app sending each MCP session's requests to the worker that created it.
+
+    Requests without a session ID, such as initialize, go to the workers in
+    turn. The session ID in the response ties the session to that worker.
+    Workers that exit are replaced, ending their sessions, and sessions
+    without requests or open streams for MCP_SESSION_IDLE_TIMEOUT are ended.
+    """
+
+    def __init__(self, directory: Path, workers: int):
+        self.directory = directory
+        self.workers: list[Worker] = []
+        self.worker_count = workers
+        self.sessions: dict[str, Session] = {}
+        self._turn = itertools.count()
+        self._restart_task = None
+        self._supervise_task = None
+        # Held while a worker is being replaced
+        self._replace_lock = asyncio.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+        elif scope["type"] == "http":
+            response = await self.forward(Request(scope, receive))
+            await response(scope, receive, send)
+
+    async def lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.start()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def start(self) -> None:
+        self.workers = [
+            Worker(self.directory, index) for index in range(self.worker_count)
+        ]
+        await asyncio.gather(*(worker.start() for worker in self.workers))
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, self.restart)
+        self._supervise_task = asyncio.create_task(self._supervise())
+        logger.info(
+            "Started %d workers with session affinity; SIGHUP restarts them.",
+            self.worker_count,
+        )
+
+    async def stop(self) -> None:
+        for task in (self._supervise_task, self._restart_task):
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(*(worker.stop() for worker in self.workers))
+
+    def restart(self) -> None:
+        """Replace the workers one at a time."""
+        if self._restart_task is None or self._restart_task.done():
+            self._restart_task = asyncio.create_task(self._restart_workers())
+
+    async def _restart_workers(self) -> None:
+        for index in range(len(self.workers)):
+            async with self._replace_lock:
+                if not await self._replace_worker(index):
+                    logger.error("Aborting the restart at worker %d.", index)
+                    return
+        logger.info("Restarted %d workers.", len(self.workers))
+
+    async def _replace_worker(self, index: int) -> bool:
+        """Start a new worker in the slot and stop the old one."""
+        old_worker = self.workers[index]
+        new_worker = Worker(self.directory, index)
+        try:
+            await new_worker.start()
+        except RuntimeError:
+            logger.exception("Could not start a replacement for worker %d.", index)
+            return False
+        self.workers[index] = new_worker
+        await old_worker.stop()
+        self.sessions = {
+            session_id: session
+            for session_id, session in self.sessions.items()
+            if session.worker is not old_worker
+        }
+        return True
+
+    async def _supervise(self) -> None:
+        """Replace exited workers and end idle sessions."""
+        while True:
+            await asyncio.sleep(SUPERVISE_INTERVAL)
+            try:
+                await self._replace_exited_workers()
+                await self._end_idle_sessions()
+            except Exception:
+                logger.exception("Worker and session checks failed.")
+
+    async def _replace_exited_workers(self) -> None:
+        for index, worker in enumerate(self.workers):
+            if worker.process.is_alive():
+                continue
+            async with self._replace_lock:
+                if self.workers[index] is worker:
+                    logger.warning(
+                        "Worker %d exited with code %s; replacing it.",
+                        index,
+                        worker.process.exitcode,
+                    )
+                    await self._replace_worker(index)
+
+    async def _end_idle_sessions(self) -> None:
+        cutoff = asyncio.get_running_loop().time() - MCP_SESSION_IDLE_TIMEOUT
+        idle = [
+            session_id
+            for session_id, session in self.sessions.items()
+            if session.last_seen < cutoff and not session.streams
+        ]
+        for session_id in idle:
+            await self._end_session(session_id)
+
+    async def _end_session(self, session_id: str) -> None:
+        # Sessions can end some other way while earlier ones are being ended
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return
+        # Let the worker free the session's state too
+        with contextlib.suppress(httpx.HTTPError):
+            await session.worker.client.delete(
+                session.path,
+                headers={SESSION_ID_HEADER: session_id, "host": session.host},
+            )
+        logger.info("Ended session %s after it went idle.", session_id)
+
+    async def forward(self, request: Request):
+        loop = asyncio.get_running_loop()
+        session_id = request.headers.get(SESSION_ID_HEADER)
+        session = None
+        if session_id is None:
+            worker = self.workers[next(self._turn) % len(self.workers)]
+        else:
+            session = self.sessions.get(session_id)
+            if session is None:
+                return _session_not_found()
+            worker = session.worker
+            session.last_seen = loop.time()
+            session.streams += 1
+
+        try:
+            upstream = await worker.client.send(
+                worker.client.build_request(
+                    request.method,
+                    request.url.path,
+                    params=request.url.query,
+                    headers=[
+                        (name, value)
+                        for name, value in request.headers.raw
+                        if name.decode().lower() not in _HOP_BY_HOP_HEADERS
+                    ],
+                    content=request.stream(),
+                ),
+                stream=True,
+            )
+        except httpx.ConnectError:
+            # The worker exited; the supervisor replaces it
+            if session is None:
+                return JSONResponse(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": None,
+                        "error": {"code": -32603, "message": "Worker unavailable"},
+                    },
+                    status_code=503,
+                )
+            self._release(session)
+            if self.sessions.get(session_id) is session:
+                del self.sessions[session_id]
+            return _session_not_found()
+        except BaseException:
+            self._release(session)
+            raise
+
+        new_session_id = upstream.headers.get(SESSION_ID_HEADER)
+        if new_session_id is not None and new_session_id not in self.sessions:
+            self.sessions[new_session_id] = Session(
+                worker,
+                request.url.path,
+                request.headers.get("host", ""),
+                last_seen=loop.time(),
+            )
+        if session_id is not None and (
+            upstream.status_code == 404
+            or (request.method == "DELETE" and upstream.is_success)
+        ):
+            self.sessions.pop(session_id, None)
+
+        async def close() -> None:
+            try:
+                await upstream.aclose()
+            finally:
+                self._release(session)
+
+        return StreamingResponse(
+            upstream.aiter_raw(),
+            status_code=upstream.status_code,
+            headers={
+                name: value
+                for name, value in upstream.headers.items()
+                if name.lower() not in _HOP_BY_HOP_HEADERS
+            },
+            background=BackgroundTask(close),
+        )
+
+    def _release(self, session: Session | None) -> None:
+        # Idle time counts from the end of the session's last response
+        if session is not None:
+            session.streams -= 1
+            session.last_seen = asyncio.get_running_loop().time()
@@ -2,24 +2,85 @@
 
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
 
+import httpx
 from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
 
-from $${name_snake} import tools
-from $${name_snake}.mcp_utils import register_tools_from_module
+from $${name_snake}.http_client import shared_http_client
+from $${name_snake}.http_server import (
+    MCP_HOST,
+    MCP_PORT,
+    MCP_STATELESS,
+    run_http_server,
+)
+from $${name_snake}.mcp_utils import get_entry_point_modules, load_tools
 
 MCP_TRANSPORT = os.environ.get("MCP_TRANSPORT", "stdio")
 
+# Modules with @mcp_tool functions. Packages can add their own tools modules
+# under the TOOL_ENTRY_POINT_GROUP entry point group.
+TOOL_MODULES = ["$${name_snake}.tools"]
+TOOL_ENTRY_POINT_GROUP = "$${name_snake}.tools"
+
+# Tool names and schemas, so startup doesn't import the tool modules
+TOOL_MANIFEST = Path(__file__).with_name("tools_manifest.json")
+
 # Configure logging (never use print for STDIO-based servers)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize MCP server
-mcp = FastMCP("$${name_kebab}")
 
-# Register tools from modules
-register_tools_from_module(mcp, tools)
+@dataclass
+class AppContext:
+    """Resources shared by tool calls for the life of the server."""
+
+    http: httpx.AsyncClient
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
+    """Open shared resources when the server starts and close them on shutdown."""
+    async with shared_http_client() as http:
+        yield AppContext(http=http)
+
+
+# Initialize MCP server with tools that are imported on their first call
+mcp = FastMCP(
+    "$${name_kebab}",
+    host=MCP_HOST,
+    port=MCP_PORT,
+    stateless_http=MCP_STATELESS,
+    lifespan=lifespan,
+    tools=load_tools(
+        [*TOOL_MODULES, *get_entry_point_modules(TOOL_ENTRY_POINT_GROUP)],
+        TOOL_MANIFEST,
+    ),
+)
+
+
+def create_http_app() -> Starlette:
+    """Return the streamable HTTP app, for uvicorn workers."""
+    app = mcp.streamable_http_app()
+    session_manager_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def app_lifespan(app: Starlette) -> AsyncIterator[None]:
+        # Sessions, or requests when stateless, each run the server lifespan;
+        # holding the shared client here keeps its pool open between them
+        async with shared_http_client(), session_manager_lifespan(app):
+            yield
+
+    app.router.lifespan_context = app_lifespan
+    return app
 
 
 def run_mcp_server():
-    mcp.run(transport=MCP_TRANSPORT)
+    if MCP_TRANSPORT == "streamable-http":
+        run_http_server()
+    else:
+        mcp.run(transport=MCP_TRANSPORT)
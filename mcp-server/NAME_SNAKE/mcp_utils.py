@@ -1,15 +1,45 @@
+import base64
+import functools
+import hashlib
+import importlib
+import importlib.util
+import inspect
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
+from importlib.metadata import entry_points
+from pathlib import Path
 from types import ModuleType
+from typing import Any
+
+import orjson
+from mcp.server.fastmcp.tools import Tool
+from mcp.server.fastmcp.utilities.func_metadata import ArgModelBase, FuncMetadata
+from mcp.types import TextContent
+from pydantic import PrivateAttr
+
+from $${name_snake}.cache import ToolCache, cache_results
+from $${name_snake}.offload import RunIn, offload_calls
 
 logger = logging.getLogger(__name__)
 
 
 _TOOL_MARKER = "_mcp_tool_marker"
+_MAX_BYTES_ATTR = "_mcp_tool_max_bytes"
+_CACHE_ATTR = "_mcp_tool_cache"
+_OFFLOAD_ATTR = "_mcp_tool_offload"
+
+# Items per page when a tool doesn't pass a limit to paginate()
+DEFAULT_PAGE_SIZE = 100
 
 
-def mcp_tool() -> Callable:
+def mcp_tool(
+    max_bytes: int | None = None,
+    cache: bool | ToolCache = False,
+    run_in: RunIn | None = None,
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
+) -> Callable:
     """Decorator to mark a function as an MCP tool.
 
     Usage:
@@ -18,16 +48,98 @@ def mcp_tool() -> Callable:
             '''Tool docstring.'''
             ...
 
+        @mcp_tool(max_bytes=50_000)
+        async def list_items(cursor: str | None = None) -> dict[str, Any]:
+            '''List items, a page at a time.'''
+            return paginate(await fetch_items(), cursor)
+
+        @mcp_tool(cache=ToolCache(ttl=60))
+        async def get_forecast(city: str) -> dict[str, Any]:
+            '''Get the weather forecast for a city.'''
+            ...
+
+        @mcp_tool(run_in="process", max_concurrency=2, timeout=30)
+        def render_chart(data: list[float]) -> str:
+            '''Render a chart as an SVG.'''
+            ...
+
     The function will be registered when register_tools_from_module is called.
+
+    Args:
+        max_bytes: Cap on the tool's JSON response. Larger responses are
+            trimmed with truncate_response(), and the tool returns text only,
+            since structured content would repeat the whole payload.
+        cache: True to cache results with the default ToolCache settings, or
+            a ToolCache to choose its size, TTL and disk store.
+        run_in: "thread" or "process" to keep calls from blocking the event
+            loop, or "loop". Sync functions run in the thread pool by default.
+            Process pool tools must be module-level functions with picklable
+            arguments and results.
+        max_concurrency: Calls of this tool allowed to run at once.
+        timeout: Seconds before a call is cancelled and returned as an error.
     """
 
     def decorator(func: Callable) -> Callable:
         setattr(func, _TOOL_MARKER, True)
+        setattr(func, _MAX_BYTES_ATTR, max_bytes)
+        setattr(func, _CACHE_ATTR, ToolCache() if cache is True else cache or None)
+        setattr(func, _OFFLOAD_ATTR, (run_in, max_concurrency, timeout))
         return func
 
     return decorator
 
 
+class CompactFuncMetadata(FuncMetadata):
+    """Function metadata that sends dict and list results as compact JSON.
+
+    FastMCP pretty-prints results, and sends each list item as its own
+    content block.
+    """
+
+    def convert_result(self, result: Any) -> Any:
+        if not isinstance(result, dict | list):
+            return super().convert_result(result)
+        content = [TextContent(type="text", text=json_response(result))]
+        if self.output_schema is None:
+            return content
+        if self.wrap_output:
+            result = {"result": result}
+        validated = self.output_model.model_validate(result)
+        return content, validated.model_dump(mode="json", by_alias=True)
+
+
+def build_tool(func: Callable, name: str | None = None) -> Tool:
+    """Build a FastMCP tool from an @mcp_tool decorated function."""
+    func = offload_calls(func, *getattr(func, _OFFLOAD_ATTR, (None, None, None)))
+    cache = getattr(func, _CACHE_ATTR, None)
+    if cache is not None:
+        func = cache_results(func, cache, name=name)
+    max_bytes = getattr(func, _MAX_BYTES_ATTR, None)
+    if max_bytes is None:
+        tool = Tool.from_function(func, name=name)
+    else:
+        tool = Tool.from_function(
+            _cap_response_size(func, max_bytes), name=name, structured_output=False
+        )
+    tool.fn_metadata = CompactFuncMetadata(**dict(tool.fn_metadata))
+    return tool
+
+
+def _cap_response_size(func: Callable, max_bytes: int) -> Callable:
+    @functools.wraps(func)
+    async def wrapper(**kwargs):
+        result = func(**kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        if isinstance(result, str):
+            return result
+        return truncate_response(
+            result, max_bytes, offset=decode_cursor(kwargs.get("cursor"))
+        )
+
+    return wrapper
+
+
 def register_tools_from_module(mcp, module: ModuleType) -> None:
     """Register all @mcp_tool decorated functions from a module.
 
@@ -35,18 +147,266 @@ def register_tools_from_module(mcp, module: ModuleType) -> None:
         mcp: The FastMCP server instance.
         module: The module to scan for tool functions.
     """
+    for func in iter_tool_functions(module):
+        mcp.add_tool(build_tool(func))
+
+
+def iter_tool_functions(module: ModuleType) -> Iterable[Callable]:
+    """Yield the @mcp_tool decorated functions defined in a module."""
     for name in dir(module):
         obj = getattr(module, name)
         if callable(obj) and getattr(obj, _TOOL_MARKER, False):
-            # Register the function as a tool
-            mcp.tool()(obj)
+            yield obj
+
+
+class LazyTool(Tool):
+    """A tool described by a manifest entry, imported on its first call.
+
+    Listing tools uses the name, description and schemas from the manifest.
+    The first call imports the module, builds the real tool and delegates to it.
+    """
+
+    module: str
+    function: str
+    _tool: Tool | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_manifest_entry(cls, entry: dict[str, Any]) -> "LazyTool":
+        """Create a lazy tool from a manifest entry."""
+        return cls(
+            fn=_not_loaded,
+            name=entry["name"],
+            description=entry["description"],
+            parameters=entry["parameters"],
+            fn_metadata=FuncMetadata(
+                arg_model=ArgModelBase, output_schema=entry.get("output_schema")
+            ),
+            is_async=True,
+            module=entry["module"],
+            function=entry["function"],
+        )
+
+    def load(self) -> Tool:
+        """Import the tool's module and return the real tool."""
+        if self._tool is None:
+            module = importlib.import_module(self.module)
+            self._tool = build_tool(getattr(module, self.function), name=self.name)
+        return self._tool
+
+    async def run(self, arguments, context=None, convert_result=False):
+        return await self.load().run(arguments, context, convert_result)
+
+
+def _not_loaded(**kwargs):
+    msg = "Lazy tools are called through LazyTool.run."
+    raise RuntimeError(msg)
+
+
+def get_entry_point_modules(group: str) -> list[str]:
+    """Return the tool modules other packages declare under an entry point group.
+
+    A plugin package declares its tools module in its pyproject.toml:
+
+        [project.entry-points."my_server.tools"]
+        my_plugin = "my_plugin.tools"
+    """
+    return [entry_point.value for entry_point in entry_points(group=group)]
+
+
+def _get_module_file(module_name: str) -> str | None:
+    spec = importlib.util.find_spec(module_name)
+    return spec.origin if spec is not None else None
+
 
+def _get_source_hash(path: str | None) -> str | None:
+    # Content hashes stay valid when installing resets file times
+    if path is None:
+        return None
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
 
-def json_response(data: dict) -> str:
-    """Return a JSON response."""
-    return json.dumps(data, indent=2)
+
+def build_tool_manifest(module_names: Iterable[str]) -> dict[str, Any]:
+    """Import tool modules and describe every tool they define.
+
+    Args:
+        module_names: Dotted paths of the modules to scan.
+
+    Returns:
+        A manifest with each module's source hash and each tool's module,
+        function name, description and schemas.
+    """
+    manifest = {"modules": {}, "tools": []}
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        manifest["modules"][module_name] = _get_source_hash(module.__file__)
+        for func in iter_tool_functions(module):
+            tool = build_tool(func)
+            manifest["tools"].append(
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.parameters,
+                    "output_schema": tool.output_schema,
+                    "module": module_name,
+                    "function": func.__name__,
+                }
+            )
+    return manifest
+
+
+def write_tool_manifest(module_names: Iterable[str], path: Path) -> dict[str, Any]:
+    """Build a tool manifest and write it to a JSON file."""
+    manifest = build_tool_manifest(module_names)
+    path.write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def _is_manifest_current(manifest: dict[str, Any], module_names: list[str]) -> bool:
+    if list(manifest.get("modules", {})) != module_names:
+        return False
+    return all(
+        _get_source_hash(_get_module_file(module_name)) == source_hash
+        for module_name, source_hash in manifest["modules"].items()
+    )
+
+
+def load_tools(module_names: Iterable[str], manifest_path: Path) -> list[Tool]:
+    """Return lazy tools for the given modules, using a manifest when possible.
+
+    The manifest is reused while every module's source is unchanged, so
+    starting the server imports none of the tool modules. Otherwise the
+    modules are scanned and the manifest is rewritten when the location is
+    writable.
+
+    Args:
+        module_names: Dotted paths of the tool modules.
+        manifest_path: Where the manifest is stored.
+
+    Returns:
+        Tools to pass to FastMCP(tools=...).
+    """
+    module_names = list(module_names)
+    manifest = None
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text())
+        if not _is_manifest_current(manifest, module_names):
+            logger.info("Tool manifest is out of date, rebuilding it.")
+            manifest = None
+
+    if manifest is None:
+        manifest = build_tool_manifest(module_names)
+        try:
+            manifest_path.write_text(json.dumps(manifest, indent=2))
+        except OSError:
+            logger.warning("Could not write tool manifest to %s.", manifest_path)
+
+    return [LazyTool.from_manifest_entry(entry) for entry in manifest["tools"]]
+
+
+def json_response(data: Any, indent: bool = False) -> str:
+    """Return a JSON response, compact unless indent is set."""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=str, option=option).decode()
 
 
 def json_success_response(**kwargs) -> str:
     """Return a JSON success response."""
     return json_response({"success": True, **kwargs})
+
+
+def encode_cursor(offset: int) -> str:
+    """Return an opaque cursor for a position in a result list."""
+    return base64.urlsafe_b64encode(str(offset).encode()).decode()
+
+
+def decode_cursor(cursor: str | None) -> int:
+    """Return the position a cursor points to, or 0 for no cursor."""
+    if not cursor:
+        return 0
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError as e:
+        msg = f"Invalid cursor: {cursor!r}"
+        raise ValueError(msg) from e
+
+
+def paginate(
+    items: Sequence, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE
+) -> dict[str, Any]:
+    """Return one page of items and the cursor for the next page.
+
+    Args:
+        items: The full result list.
+        cursor: The cursor from the previous page, or None for the first.
+        limit: The maximum number of items per page.
+
+    Returns:
+        {"items": [...], "next_cursor": ...}, where next_cursor is None on the
+        last page.
+    """
+    offset = decode_cursor(cursor)
+    end = offset + limit
+    return {
+        "items": list(items[offset:end]),
+        "next_cursor": encode_cursor(end) if end < len(items) else None,
+    }
+
+
+def truncate_response(data: Any, max_bytes: int, offset: int = 0) -> str:
+    """Return data as compact JSON, trimming its list to fit in max_bytes.
+
+    A list result, or the longest list in a dict result, keeps as many leading
+    items as fit. Trimmed responses get "truncated": true, the number of
+    "omitted" items and a "next_cursor" for continuing from the first omitted
+    item.
+
+    Args:
+        data: The tool result.
+        max_bytes: The size limit of the encoded response.
+        offset: Position of the list's first item in the full result, from
+            the tool's cursor argument.
+
+    Returns:
+        The JSON encoded response.
+    """
+    text = json_response(data)
+    if len(text.encode()) <= max_bytes:
+        return text
+
+    if isinstance(data, list):
+        data, key = {"items": data}, "items"
+    else:
+        lists = []
+        if isinstance(data, dict):
+            lists = [k for k, v in data.items() if isinstance(v, list)]
+        if not lists:
+            msg = f"Response is larger than {max_bytes} bytes and has no list to truncate."
+            raise ValueError(msg)
+        key = max(lists, key=lambda k: len(data[k]))
+    items = data[key]
+
+    def encode(count: int) -> bytes:
+        trimmed = {
+            **data,
+            key: items[:count],
+            "truncated": True,
+            "omitted": len(items) - count,
+            "next_cursor": encode_cursor(offset + count),
+        }
+        return orjson.dumps(trimmed, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    # Largest item count that fits, found by bisection
+    low, high = 0, len(items)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if len(encode(middle)) <= max_bytes:
+            low = middle
+        else:
+            high = middle - 1
+    body = encode(low)
+    if len(body) > max_bytes:
+        msg = f"Response is larger than {max_bytes} bytes even without list items."
+        raise ValueError(msg)
+    return body.decode()
@@ -0,0 +1,129 @@
+"""Blocking-call offload and concurrency limits for $${name_pretty} MCP tools."""
+
+import asyncio
+import contextlib
+import functools
+import inspect
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, Literal
+
+from mcp.server.fastmcp import Context
+from mcp.server.fastmcp.exceptions import ToolError
+
+TOOL_THREAD_WORKERS = int(os.environ.get("TOOL_THREAD_WORKERS", "32"))
+TOOL_PROCESS_WORKERS = int(
+    os.environ.get("TOOL_PROCESS_WORKERS", str(os.cpu_count() or 1))
+)
+
+RunIn = Literal["loop", "thread", "process"]
+
+_executors: dict[str, Executor] = {}
+
+
+def get_executor(run_in: RunIn) -> Executor:
+    """Return the shared thread or process pool, creating it on first use."""
+    if run_in not in _executors:
+        if run_in == "thread":
+            _executors[run_in] = ThreadPoolExecutor(
+                TOOL_THREAD_WORKERS, thread_name_prefix="mcp-tool"
+            )
+        else:
+            # Spawned workers don't inherit the server's event loop or threads
+            _executors[run_in] = ProcessPoolExecutor(
+                TOOL_PROCESS_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+    return _executors[run_in]
+
+
+def _call(func: Callable, kwargs: dict[str, Any]) -> Any:
+    # Runs in a worker thread or process, where async tools get their own loop
+    result = func(**kwargs)
+    if inspect.isawaitable(result):
+        result = asyncio.run(result)
+    return result
+
+
+def offload_calls(
+    func: Callable,
+    run_in: RunIn | None = None,
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
+) -> Callable:
+    """Wrap a tool function to run off the event loop, with limits.
+
+    Args:
+        func: The tool function.
+        run_in: "thread" or "process" to run calls in a pool, or "loop" to run
+            them on the event loop. Defaults to "thread" for sync functions
+            and "loop" for async ones.
+        max_concurrency: Calls allowed to run at once; others wait their turn.
+        timeout: Seconds before a call is cancelled and reported as an error.
+            Work already running in a thread or process can't be interrupted,
+            so it finishes in the background and holds its concurrency slot
+            until then.
+
+    Returns:
+        An async function with the same signature.
+    """
+    if run_in is None:
+        run_in = "loop" if inspect.iscoroutinefunction(func) else "thread"
+    if run_in == "process" and any(
+        parameter.annotation is Context
+        for parameter in inspect.signature(func).parameters.values()
+    ):
+        msg = f"{func.__name__} takes a Context, which can't be sent to a process."
+        raise ValueError(msg)
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    def release() -> None:
+        if semaphore is not None:
+            semaphore.release()
+
+    async def run(kwargs: dict[str, Any]) -> Any:
+        if run_in == "loop":
+            try:
+                result = func(**kwargs)
+                return await result if inspect.isawaitable(result) else result
+            finally:
+                release()
+        loop = asyncio.get_running_loop()
+
+        def on_done(_future: Future) -> None:
+            # Runs in the pool's thread once the call finishes. If the loop
+            # has closed, the semaphore is gone with it.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(release)
+
+        try:
+            future = get_executor(run_in).submit(_call, func, kwargs)
+        except BaseException:
+            release()
+            raise
+        # A timeout can't stop a call that's already running in the pool, so
+        # its slot is only freed once the call itself finishes
+        future.add_done_callback(on_done)
+        return await asyncio.wrap_future(future)
+
+    @functools.wraps(func)
+    async def wrapper(**kwargs):
+        deadline = asyncio.timeout(timeout)
+        try:
+            async with deadline:
+                if semaphore is not None:
+                    await semaphore.acquire()
+                return await run(kwargs)
+        except TimeoutError as e:
+            if not deadline.expired():
+                raise
+            msg = f"{func.__name__} timed out after {timeout}s."
+            raise ToolError(msg) from e
+
+    return wrapper
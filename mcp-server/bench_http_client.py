@@ -0,0 +1,115 @@
+"""Compare per-call HTTP clients with the shared client from the server lifespan.
+
+Starts a local stand-in HTTP server and calls two tools through an in-memory
+MCP session: one that opens a new httpx.AsyncClient per call, as a tool
+without the shared client would, and one using get_http_client(ctx).
+
+    uv run python bench_http_client.py --calls 200 --tls
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from $${name_snake}.http_client import get_http_client
+from $${name_snake}.mcp import lifespan
+
+
+async def items(request):
+    return JSONResponse({"items": list(range(100))})
+
+
+def create_certificate(directory: Path) -> tuple[str, str]:
+    """Create a self-signed certificate for localhost with openssl."""
+    certfile, keyfile = str(directory / "cert.pem"), str(directory / "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", keyfile, "-out", certfile, "-days", "1",
+            "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certfile, keyfile
+
+
+def create_server() -> FastMCP:
+    server = FastMCP("bench", lifespan=lifespan)
+
+    @server.tool()
+    async def fetch_new_client(url: str) -> int:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(url)
+        return response.status_code
+
+    @server.tool()
+    async def fetch_shared_client(url: str, ctx: Context) -> int:
+        response = await get_http_client(ctx).get(url)
+        return response.status_code
+
+    return server
+
+
+async def run(calls: int, port: int, tls: bool) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        ssl_options = {}
+        if tls:
+            certfile, keyfile = create_certificate(Path(directory))
+            ssl_options = {"ssl_certfile": certfile, "ssl_keyfile": keyfile}
+            # Trusted by both clients through httpx's trust_env
+            os.environ["SSL_CERT_FILE"] = certfile
+
+        app = Starlette(routes=[Route("/items", items)])
+        http_server = uvicorn.Server(
+            uvicorn.Config(app, port=port, log_level="warning", **ssl_options)
+        )
+        server_task = asyncio.create_task(http_server.serve())
+        while not http_server.started:
+            await asyncio.sleep(0.01)
+
+        scheme = "https" if tls else "http"
+        url = f"{scheme}://127.0.0.1:{port}/items"
+        server = create_server()
+        print(f"{'client':<8} {'p50 (ms)':>9} {'p95 (ms)':>9} {'calls/s':>9}")
+        async with create_connected_server_and_client_session(server) as session:
+            for name in ("new", "shared"):
+                tool = f"fetch_{name}_client"
+                await session.call_tool(tool, {"url": url})
+                timings = []
+                for _ in range(calls):
+                    start = time.perf_counter()
+                    result = await session.call_tool(tool, {"url": url})
+                    timings.append(time.perf_counter() - start)
+                    if result.isError:
+                        raise RuntimeError(result.content[0].text)
+                quantiles = statistics.quantiles(timings, n=100)
+                print(
+                    f"{name:<8} {quantiles[49] * 1000:>9.2f} "
+                    f"{quantiles[94] * 1000:>9.2f} {calls / sum(timings):>9.0f}"
+                )
+
+        http_server.should_exit = True
+        await server_task
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--tls", action="store_true", help="Serve over HTTPS.")
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.port, args.tls))
@@ -0,0 +1,337 @@
+"""Benchmark tool call latency and throughput across MCP transports.
+
+Drives a weighted mix of tools at each concurrency level through the server
+in mcp.py, in-process (memory streams), over stdio and over streamable HTTP,
+and writes the results to JSON. Pass an earlier results file with --compare
+to see what changed.
+
+    uv run python bench_mcp.py --tool hello_world:3 --tool search:1 \\
+        --arguments '{"search": {"query": "bench"}}' --concurrency 1 16
+
+Per-tool overhead is the call's p50 latency minus the p50 of calling the
+tool function directly, i.e. the time spent in the protocol, transport and
+tool wrappers.
+"""
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.server.fastmcp import Context
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from $${name_snake}.mcp import mcp
+
+TRANSPORTS = ["in-process", "stdio", "http"]
+DEFAULT_ARGUMENTS = {"hello_world": {"name": "bench"}}
+RESULTS_DIR = Path("benchmarks")
+
+# Seconds the HTTP server has to start listening
+HTTP_START_TIMEOUT = 30
+
+# Direct calls per tool when measuring its own run time
+DIRECT_CALLS = 100
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """Return p50, p95 and p99 in milliseconds."""
+    if len(values) < 2:
+        values = values * 2 or [0.0, 0.0]
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {
+        "p50": round(cuts[49] * 1000, 3),
+        "p95": round(cuts[94] * 1000, 3),
+        "p99": round(cuts[98] * 1000, 3),
+    }
+
+
+@asynccontextmanager
+async def in_process_session():
+    async with create_connected_server_and_client_session(mcp) as session:
+        yield session
+
+
+@asynccontextmanager
+async def stdio_session():
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "$${name_snake}"],
+        env={**os.environ, "MCP_TRANSPORT": "stdio"},
+    )
+    async with (
+        stdio_client(params, errlog=subprocess.DEVNULL) as (read, write),
+        ClientSession(read, write) as session,
+    ):
+        await session.initialize()
+        yield session
+
+
+@asynccontextmanager
+async def http_session():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, "-m", "$${name_snake}"],
+        env={
+            **os.environ,
+            "MCP_TRANSPORT": "streamable-http",
+            "MCP_HOST": "127.0.0.1",
+            "MCP_PORT": str(port),
+        },
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        await wait_for_port(port, server)
+        async with (
+            streamablehttp_client(f"http://127.0.0.1:{port}/mcp") as (read, write, _),
+            ClientSession(read, write) as session,
+        ):
+            await session.initialize()
+            yield session
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def wait_for_port(port: int, server: subprocess.Popen) -> None:
+    deadline = time.monotonic() + HTTP_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            break
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        return
+    msg = f"The HTTP server did not start listening on port {port}."
+    raise RuntimeError(msg)
+
+
+SESSIONS = {
+    "in-process": in_process_session,
+    "stdio": stdio_session,
+    "http": http_session,
+}
+
+
+async def run_load(
+    session: ClientSession,
+    mix: dict[str, int],
+    arguments: dict[str, dict],
+    concurrency: int,
+    requests: int,
+) -> dict:
+    """Make requests tool calls with concurrency calls in flight at a time."""
+    rng = random.Random(0)
+    calls = rng.choices(list(mix), weights=list(mix.values()), k=requests)
+    timings = {name: [] for name in mix}
+    errors = {name: 0 for name in mix}
+
+    async def worker():
+        while calls:
+            name = calls.pop()
+            start = time.perf_counter()
+            result = await session.call_tool(name, arguments.get(name, {}))
+            timings[name].append(time.perf_counter() - start)
+            if result.isError:
+                errors[name] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    all_timings = [timing for values in timings.values() for timing in values]
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "throughput": round(requests / elapsed, 1),
+        "latency_ms": percentiles(all_timings),
+        "tools": {
+            name: {
+                "calls": len(timings[name]),
+                "errors": errors[name],
+                "latency_ms": percentiles(timings[name]),
+            }
+            for name in mix
+        },
+    }
+
+
+async def time_direct_calls(
+    mix: dict[str, int], arguments: dict[str, dict]
+) -> dict[str, float | None]:
+    """Return each tool function's p50 in milliseconds, called without MCP.
+
+    Tools that take a Context can't be called directly and get None.
+    """
+    tools = {tool.name: tool for tool in mcp._tool_manager.list_tools()}
+    direct = {}
+    for name in mix:
+        tool = tools[name]
+        func = getattr(importlib.import_module(tool.module), tool.function)
+        if any(
+            parameter.annotation is Context
+            for parameter in inspect.signature(func).parameters.values()
+        ):
+            direct[name] = None
+            continue
+        timings = []
+        for _ in range(DIRECT_CALLS):
+            start = time.perf_counter()
+            result = func(**arguments.get(name, {}))
+            if inspect.isawaitable(result):
+                await result
+            timings.append(time.perf_counter() - start)
+        direct[name] = percentiles(timings)["p50"]
+    return direct
+
+
+async def run_benchmark(args) -> dict:
+    mix = dict(parse_tool(spec) for spec in args.tool)
+    arguments = {**DEFAULT_ARGUMENTS, **json.loads(args.arguments)}
+    direct = await time_direct_calls(mix, arguments)
+
+    runs = []
+    for transport in args.transport:
+        async with SESSIONS[transport]() as session:
+            # Load the tools and open connections before timing
+            await run_load(session, mix, arguments, 1, len(mix) * 2)
+            for concurrency in args.concurrency:
+                result = await run_load(
+                    session, mix, arguments, concurrency, args.requests
+                )
+                for name, tool_result in result["tools"].items():
+                    tool_result["overhead_ms"] = (
+                        round(tool_result["latency_ms"]["p50"] - direct[name], 3)
+                        if direct[name] is not None
+                        else None
+                    )
+                runs.append({"transport": transport, **result})
+                print_run(runs[-1])
+
+    return {
+        "version": get_version(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mix": mix,
+        "direct_p50_ms": direct,
+        "runs": runs,
+    }
+
+
+def parse_tool(spec: str) -> tuple[str, int]:
+    name, _, weight = spec.partition(":")
+    return name, int(weight or 1)
+
+
+def get_version() -> str | None:
+    try:
+        return version("$${name_kebab}")
+    except PackageNotFoundError:
+        return None
+
+
+def print_run(run: dict) -> None:
+    latency = run["latency_ms"]
+    print(
+        f"{run['transport']:<11} {run['concurrency']:>5} {run['throughput']:>10.1f} "
+        f"{latency['p50']:>8.2f} {latency['p95']:>8.2f} {latency['p99']:>8.2f}"
+    )
+    for name, tool in run["tools"].items():
+        overhead = tool["overhead_ms"]
+        print(
+            f"    {name}: p50 {tool['latency_ms']['p50']:.2f} ms, overhead "
+            f"{'n/a' if overhead is None else f'{overhead:.2f} ms'}, "
+            f"errors {tool['errors']}"
+        )
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """Print the change in throughput and latency from a baseline run."""
+    previous = {(run["transport"], run["concurrency"]): run for run in baseline["runs"]}
+    print(f"\nCompared with {baseline.get('version')} ({baseline['timestamp']}):")
+    for run in results["runs"]:
+        old = previous.get((run["transport"], run["concurrency"]))
+        if old is None:
+            continue
+        changes = [
+            f"throughput {change(old['throughput'], run['throughput'])}",
+            *(
+                f"{key} {change(old['latency_ms'][key], run['latency_ms'][key])}"
+                for key in ("p50", "p95", "p99")
+            ),
+        ]
+        print(f"{run['transport']:<11} {run['concurrency']:>5}  " + ", ".join(changes))
+
+
+def change(old: float, new: float) -> str:
+    return f"{(new - old) / old:+.1%}" if old else "n/a"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--tool",
+        action="append",
+        help="Tool to call, with an optional weight: NAME[:WEIGHT]. "
+        "Defaults to hello_world.",
+    )
+    parser.add_argument(
+        "--arguments",
+        default="{}",
+        help='JSON object of arguments per tool, e.g. \'{"search": {"query": "x"}}\'.',
+    )
+    parser.add_argument(
+        "--transport", nargs="+", choices=TRANSPORTS, default=TRANSPORTS
+    )
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument(
+        "--requests", type=int, default=500, help="Tool calls per run."
+    )
+    parser.add_argument("--output", type=Path, help="Results file to write.")
+    parser.add_argument("--compare", type=Path, help="Earlier results file.")
+    args = parser.parse_args()
+    args.tool = args.tool or ["hello_world"]
+
+    print(
+        f"{'transport':<11} {'conc.':>5} {'calls/s':>10} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    results = asyncio.run(run_benchmark(args))
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+        output = RESULTS_DIR / f"bench-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nWrote {output}")
+
+    if args.compare is not None:
+        compare(results, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""Write the tool manifest used for lazy tool loading.
+
+Run after changing tools, or as a build step, so the server never has to
+import the tool modules to list them:
+
+    uv run python build_tool_manifest.py
+"""
+
+from $${name_snake}.mcp import TOOL_ENTRY_POINT_GROUP, TOOL_MANIFEST, TOOL_MODULES
+from $${name_snake}.mcp_utils import get_entry_point_modules, write_tool_manifest
+
+if __name__ == "__main__":
+    manifest = write_tool_manifest(
+        [*TOOL_MODULES, *get_entry_point_modules(TOOL_ENTRY_POINT_GROUP)],
+        TOOL_MANIFEST,
+    )
+    print(f"Wrote {len(manifest['tools'])} tools to {TOOL_MANIFEST}")